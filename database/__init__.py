@@ -1,4 +1,4 @@
 # Este archivo permite que 'database' sea un paquete de Python
-from .conexion import get_connection, create_table_empleados, create_table_departamentos, create_table_registros_tiempo, create_table_proyectos, create_table_empleado_proyecto, create_table_usuarios
+from .conexion import get_connection, get_async_pool, close_async_pool, transaction, current_connection, commit_outside_transaction, create_table_empleados, create_table_departamentos, create_table_registros_tiempo, create_table_proyectos, create_table_empleado_proyecto, create_table_usuarios
 
-__all__ = ['get_connection', 'create_table_empleados', 'create_table_departamentos', 'create_table_registros_tiempo', 'create_table_proyectos', 'create_table_empleado_proyecto', 'create_table_usuarios']
\ No newline at end of file
+__all__ = ['get_connection', 'get_async_pool', 'close_async_pool', 'transaction', 'current_connection', 'commit_outside_transaction', 'create_table_empleados', 'create_table_departamentos', 'create_table_registros_tiempo', 'create_table_proyectos', 'create_table_empleado_proyecto', 'create_table_usuarios']
\ No newline at end of file
@@ -1,5 +1,8 @@
+import asyncio
+import contextvars
 import oracledb
 import os
+from contextlib import contextmanager
 from dotenv import load_dotenv
 
 # Cargar variables de entorno desde .env
@@ -13,6 +16,58 @@ username = os.getenv("ORACLE_USER")
 dsn = os.getenv("ORACLE_DSN")
 password = os.getenv("ORACLE_PASSWORD")
 
+# Tamaño de la caché de sentencias por conexión (por defecto oracledb guarda 20).
+# Los modelos definen su SQL como constantes de módulo, así que cada texto se
+# parsea una vez y las siguientes ejecuciones salen de esta caché.
+STMT_CACHE_SIZE = 200
+
+# Las columnas NUMBER llegan como int/float de Python y no como decimal.Decimal.
+# Es el valor por defecto de oracledb, pero lo dejo explícito porque los modelos
+# (por ejemplo RegistroTiempo._from_row) usan los valores tal cual, sin float().
+oracledb.defaults.fetch_decimals = False
+
+
+# Oracle admite como máximo 1000 expresiones en una lista IN (ORA-01795); las
+# consultas por lote de los modelos se dividen en grupos de este tamaño.
+MAX_BINDS_IN = 1000
+
+# Códigos de error de Oracle que distinguen los modelos. Comparo el código numérico
+# en vez de buscar texto en str(e): no depende del idioma (NLS_LANG) del servidor.
+ORA_UNIQUE = 1        # ORA-00001: restricción única violada
+ORA_FK_PADRE = 2291   # ORA-02291: clave padre no encontrada
+
+
+# Pool de conexiones compartido por toda la aplicación. Lo creo la primera vez
+# que se pide una conexión y después solo se reutiliza.
+_pool = None
+
+
+def _configurar_sesion(connection, requested_tag):
+    """
+    Se ejecuta una vez por cada sesión nueva que abre el pool (no en cada acquire()).
+    Dejo el formato de fecha fijo para que cualquier conversión implícita sea igual
+    en todas las sesiones, independiente de la configuración del cliente.
+    """
+    with connection.cursor() as cur:
+        cur.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD'")
+
+
+def _obtener_pool():
+    """Crea el pool de conexiones la primera vez y lo retorna."""
+    global _pool
+    if _pool is None:
+        _pool = oracledb.create_pool(
+            user=username, password=password, dsn=dsn,
+            min=2, max=10, increment=1,
+            # Si las 10 conexiones están ocupadas, acquire() espera a que se libere
+            # una en vez de fallar (es el modo por defecto, lo dejo explícito)
+            getmode=oracledb.POOL_GETMODE_WAIT,
+            stmtcachesize=STMT_CACHE_SIZE,
+            session_callback=_configurar_sesion
+        )
+        print("[OK] Pool de conexiones a Oracle Database creado")
+    return _pool
+
 
 def get_connection():
     """
@@ -20,14 +75,128 @@ def get_connection():
     Esta es la única función que se debe usar en toda la aplicación para conectarse a la BD.
     Así centralizo toda la lógica de conexión en un solo lugar, lo que facilita
     mantenimiento y cambios futuros (por ejemplo, cambiar de Oracle a PostgreSQL).
+    
+    La conexión se toma de un pool: abrir una conexión nueva a Oracle (TCP, TLS y
+    autenticación) cuesta mucho más que la consulta en sí. Al salir del bloque
+    'with get_connection() as conn' la conexión vuelve al pool en vez de cerrarse,
+    y conserva su caché de sentencias para la siguiente llamada.
     """
     try:
-        connection = oracledb.connect(user=username, password=password, dsn=dsn)
-        print("[OK] Conexión exitosa a Oracle Database")
-        return connection
+        conn = _obtener_pool().acquire()
     except oracledb.DatabaseError as e:
         print(f"[ERROR] Error al conectar a la base de datos: {e}")
         raise
+    # Sin autocommit: cada método decide cuándo confirmar con conn.commit(), y las
+    # consultas de solo lectura no generan ningún COMMIT
+    conn.autocommit = False
+    return conn
+
+
+# Conexión de la transacción en curso (ver transaction()). Uso una ContextVar para
+# que cada hilo o tarea de asyncio tenga la suya.
+_conexion_transaccion = contextvars.ContextVar("conexion_transaccion", default=None)
+
+
+@contextmanager
+def transaction():
+    """
+    Agrupa varias operaciones de escritura de los modelos en una sola transacción.
+    Todos los métodos de Proyecto y RegistroTiempo llamados dentro del bloque usan
+    la misma conexión y no hacen commit por su cuenta; al salir se hace un único
+    commit, o rollback si hubo una excepción. Un bloque anidado se suma al exterior.
+    
+    Uso:
+        with transaction():
+            proyecto.crear()
+            for registro in registros:
+                registro.crear()
+    
+    Yields:
+        Connection: La conexión usada por la transacción
+    """
+    conn_actual = _conexion_transaccion.get()
+    if conn_actual is not None:
+        yield conn_actual
+        return
+    
+    with get_connection() as conn:
+        token = _conexion_transaccion.set(conn)
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            _conexion_transaccion.reset(token)
+
+
+@contextmanager
+def current_connection():
+    """
+    Entrega la conexión de la transacción en curso si existe; si no, una nueva
+    del pool que se devuelve al salir del bloque. Los modelos la usan en lugar de
+    get_connection() para sumarse a transaction() cuando está activa.
+    """
+    conn = _conexion_transaccion.get()
+    if conn is not None:
+        yield conn
+    else:
+        with get_connection() as conn:
+            yield conn
+
+
+def commit_outside_transaction(conn):
+    """
+    Hace commit salvo que estemos dentro de transaction(), que confirma todo al salir.
+    """
+    if _conexion_transaccion.get() is None:
+        conn.commit()
+
+
+# Pool asíncrono compartido y el event loop al que pertenece. Las conexiones
+# asíncronas quedan ligadas al loop donde se crearon, así que si cambia el loop
+# (por ejemplo, un segundo asyncio.run()) creo un pool nuevo para el loop actual.
+_async_pool = None
+_async_pool_loop = None
+
+
+def get_async_pool():
+    """
+    Retorna el pool de conexiones asíncronas a Oracle (python-oracledb modo async)
+    del event loop en ejecución. Debe llamarse desde una corrutina.
+    Lo usan los métodos *_async de los modelos para que varias consultas puedan
+    esperar la red al mismo tiempo con asyncio.gather().
+    Uso: async with get_async_pool().acquire() as conn: ...
+    Antes de que termine el loop conviene llamar 'await close_async_pool()'.
+    """
+    global _async_pool, _async_pool_loop
+    loop = asyncio.get_running_loop()
+    if _async_pool is None or _async_pool_loop is not loop:
+        # Un pool de un loop anterior ya no se puede usar ni cerrar desde este;
+        # lo descarto y sus conexiones se liberan al recolectarlo
+        try:
+            _async_pool = oracledb.create_pool_async(
+                user=username, password=password, dsn=dsn, min=1, max=10, increment=1,
+                stmtcachesize=STMT_CACHE_SIZE
+            )
+        except oracledb.DatabaseError as e:
+            print(f"[ERROR] Error al crear el pool asíncrono: {e}")
+            raise
+        _async_pool_loop = loop
+    return _async_pool
+
+
+async def close_async_pool():
+    """
+    Cierra el pool asíncrono del event loop en ejecución, si existe.
+    Uso: al final de la corrutina principal, antes de que asyncio.run() cierre el loop.
+    """
+    global _async_pool, _async_pool_loop
+    if _async_pool is not None and _async_pool_loop is asyncio.get_running_loop():
+        pool = _async_pool
+        _async_pool = _async_pool_loop = None
+        await pool.close()
 
 
 def create_table_departamentos():
@@ -104,7 +273,8 @@ def create_table_empleados():
 
 def create_table_registros_tiempo():
     """
-    Crea la tabla 'registros_tiempo' en la base de datos si no existe.
+    Crea la tabla 'registros_tiempo' en la base de datos si no existe,
+    junto con los índices que usan sus consultas de lectura.
     Registra horas trabajadas por empleados en proyectos.
     """
     ddl = """
@@ -120,6 +290,18 @@ def create_table_registros_tiempo():
             REFERENCES empleados(rut)
     )
     """
+    # Índices para las consultas de RegistroTiempo:
+    # - leer_por_empleado(): WHERE empleado_rut = :rut ORDER BY fecha_registro DESC
+    # - leer_por_proyecto(): WHERE UPPER(proyecto) = UPPER(:proyecto) (índice funcional)
+    # - listar_todos(): ORDER BY fecha_registro DESC
+    ddl_indices = {
+        'IX_REGTIME_EMP_FECHA':
+            "CREATE INDEX ix_regtime_emp_fecha ON registros_tiempo (empleado_rut, fecha_registro DESC)",
+        'IX_REGTIME_PROY_UPPER':
+            "CREATE INDEX ix_regtime_proy_upper ON registros_tiempo (UPPER(proyecto))",
+        'IX_REGTIME_FECHA':
+            "CREATE INDEX ix_regtime_fecha ON registros_tiempo (fecha_registro DESC)",
+    }
     
     try:
         with get_connection() as conn:
@@ -137,13 +319,26 @@ def create_table_registros_tiempo():
                 else:
                     cur.execute(ddl)
                     print("[OK] Tabla 'registros_tiempo' creada exitosamente")
+                
+                # Los verifico aparte para que también se creen en BDs ya existentes
+                cur.execute("""
+                    SELECT index_name 
+                    FROM user_indexes 
+                    WHERE table_name = 'REGISTROS_TIEMPO'
+                """)
+                existentes = {row[0] for row in cur}
+                for nombre, ddl_indice in ddl_indices.items():
+                    if nombre not in existentes:
+                        cur.execute(ddl_indice)
+                        print(f"[OK] Índice '{nombre.lower()}' creado exitosamente")
     except oracledb.DatabaseError as e:
         print(f"[ERROR] Error al crear la tabla registros_tiempo: {e}")
 
 
 def create_table_proyectos():
     """
-    Crea la tabla 'proyectos' en la base de datos si no existe.
+    Crea la tabla 'proyectos' en la base de datos si no existe,
+    junto con el índice funcional sobre UPPER(nombre).
     """
     ddl = """
     CREATE TABLE proyectos (
@@ -155,6 +350,7 @@ def create_table_proyectos():
         fecha_creacion DATE DEFAULT SYSDATE
     )
     """
+    ddl_indice_nombre = "CREATE INDEX ix_proyectos_nombre_upper ON proyectos (UPPER(nombre))"
     
     try:
         with get_connection() as conn:
@@ -172,6 +368,19 @@ def create_table_proyectos():
                 else:
                     cur.execute(ddl)
                     print("[OK] Tabla 'proyectos' creada exitosamente")
+                
+                # Índice funcional para Proyecto.leer_por_nombre(), que filtra con
+                # UPPER(nombre) = UPPER(:nombre). Sin este índice Oracle no puede usar
+                # el índice normal de 'nombre' y recorre toda la tabla.
+                # Lo verifico aparte para que también se cree en BDs ya existentes.
+                cur.execute("""
+                    SELECT COUNT(*) 
+                    FROM user_indexes 
+                    WHERE index_name = 'IX_PROYECTOS_NOMBRE_UPPER'
+                """)
+                if not cur.fetchone()[0]:
+                    cur.execute(ddl_indice_nombre)
+                    print("[OK] Índice 'ix_proyectos_nombre_upper' creado exitosamente")
     except oracledb.DatabaseError as e:
         print(f"[ERROR] Error al crear la tabla proyectos: {e}")
 
@@ -217,40 +426,73 @@ def create_table_empleado_proyecto():
         print(f"[ERROR] Error al crear la tabla empleado_proyecto: {e}")
 
 
+# ix_usuarios_login cubre todas las columnas que lee validar_credenciales(),
+# así el login se resuelve solo con el índice, sin leer la tabla.
+# (Oracle no tiene INCLUDE, por eso es un índice compuesto.)
+_SQL_CREAR_TABLA_USUARIOS = """
+    BEGIN
+        BEGIN
+            EXECUTE IMMEDIATE '
+                CREATE TABLE usuarios (
+                    id_usuario NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                    nombre_usuario VARCHAR2(50) NOT NULL UNIQUE,
+                    contraseña_hash VARCHAR2(128) NOT NULL,
+                    rol VARCHAR2(20) NOT NULL,
+                    email VARCHAR2(100),
+                    activo NUMBER DEFAULT 1,
+                    fecha_creacion DATE DEFAULT SYSDATE,
+                    ultimo_login DATE,
+                    intentos_fallidos NUMBER DEFAULT 0
+                )';
+            :creada := 1;
+        EXCEPTION
+            WHEN OTHERS THEN
+                IF SQLCODE != -955 THEN
+                    RAISE;
+                END IF;
+                :creada := 0;
+                -- Las BDs creadas antes de Argon2 tienen la columna en 64
+                -- caracteres (SHA-256); el hash Argon2id ocupa cerca de 100
+                FOR c IN (SELECT 1 FROM user_tab_columns
+                          WHERE table_name = 'USUARIOS'
+                            AND column_name = 'CONTRASEÑA_HASH'
+                            AND data_length < 128) LOOP
+                    EXECUTE IMMEDIATE 'ALTER TABLE usuarios MODIFY (contraseña_hash VARCHAR2(128))';
+                END LOOP;
+        END;
+        
+        BEGIN
+            EXECUTE IMMEDIATE '
+                CREATE INDEX ix_usuarios_login ON usuarios
+                (nombre_usuario, activo, contraseña_hash, rol, email, id_usuario)';
+        EXCEPTION
+            WHEN OTHERS THEN
+                IF SQLCODE != -955 THEN
+                    RAISE;
+                END IF;
+        END;
+    END;
+"""
+
+
 def create_table_usuarios():
     """
-    Crea la tabla 'usuarios' en la base de datos si no existe.
+    Crea la tabla 'usuarios' en la base de datos si no existe,
+    junto con el índice que usa el login.
     Para autenticación y control de acceso.
-    """
-    ddl = """
-    CREATE TABLE usuarios (
-        id_usuario NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-        nombre_usuario VARCHAR2(50) NOT NULL UNIQUE,
-        contraseña_hash VARCHAR2(64) NOT NULL,
-        rol VARCHAR2(20) NOT NULL,
-        email VARCHAR2(100),
-        activo NUMBER DEFAULT 1,
-        fecha_creacion DATE DEFAULT SYSDATE,
-        ultimo_login DATE,
-        intentos_fallidos NUMBER DEFAULT 0
-    )
-    """
     
+    Todo va en un solo bloque PL/SQL (un viaje a la BD): intento el CREATE y si
+    Oracle responde ORA-00955 (el nombre ya existe) sigo adelante, en vez de
+    consultar antes user_tables, user_tab_columns y user_indexes.
+    """
     try:
         with get_connection() as conn:
             with conn.cursor() as cur:
-                # Verificar si la tabla ya existe
-                cur.execute("""
-                    SELECT COUNT(*) 
-                    FROM user_tables 
-                    WHERE table_name = 'USUARIOS'
-                """)
-                exists = cur.fetchone()[0]
-                
-                if exists:
-                    print("[WARN] La tabla 'usuarios' ya existe")
-                else:
-                    cur.execute(ddl)
+                creada = cur.var(int)
+                cur.execute(_SQL_CREAR_TABLA_USUARIOS, {"creada": creada})
+                if creada.getvalue():
                     print("[OK] Tabla 'usuarios' creada exitosamente")
+                else:
+                    print("[WARN] La tabla 'usuarios' ya existe")
     except oracledb.DatabaseError as e:
-        print(f"[ERROR] Error al crear la tabla usuarios: {e}")
\ No newline at end of file
+        print(f"[ERROR] Error al crear la tabla usuarios: {e}")
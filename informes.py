@@ -11,7 +11,7 @@ import os
 from datetime import datetime
 from models.empleado import Empleado
 from models.departamento import Departamento
-from models.proyecto import Proyecto
+from models.proyecto import Proyecto, ProyectoError
 from models.registro_tiempo import RegistroTiempo
 
 
@@ -46,6 +46,23 @@ class GeneradorInformes:
         nombre = f"{tipo_informe}_{timestamp}.csv"
         return os.path.join(self.directorio_informes, nombre)
     
+    def _proyectos_empleado(self, rut):
+        """
+        Obtiene los proyectos de un empleado sin interrumpir el informe.
+        Si falla la consulta informo el error y sigo con el resto de empleados.
+        
+        Args:
+            rut (str): RUT del empleado
+            
+        Returns:
+            list: Lista de objetos Proyecto (vacía si hubo un error)
+        """
+        try:
+            return Proyecto.obtener_proyectos_empleado(rut)
+        except ProyectoError as e:
+            print(f"\n[ERROR] {e}")
+            return []
+    
     def informe_empleados(self, mostrar=True, exportar=False):
         """
         Genera informe de empleados.
@@ -163,7 +180,11 @@ class GeneradorInformes:
         Returns:
             str: Ruta del archivo si se exportó, None en caso contrario
         """
-        proyectos = Proyecto.listar_todos()
+        try:
+            proyectos = Proyecto.listar_todos()
+        except ProyectoError as e:
+            print(f"\n[ERROR] {e}")
+            proyectos = []
         
         if mostrar:
             print("\n" + "="*130)
@@ -212,7 +233,7 @@ class GeneradorInformes:
         Returns:
             str: Ruta del archivo si se exportó, None en caso contrario
         """
-        registros = RegistroTiempo.listar_todos()
+        registros = list(RegistroTiempo.listar_todos())
         
         if mostrar:
             print("\n" + "="*130)
@@ -282,7 +303,7 @@ class GeneradorInformes:
             
             hay_datos = False
             for emp in empleados:
-                proyectos = Proyecto.obtener_proyectos_empleado(emp.rut)
+                proyectos = self._proyectos_empleado(emp.rut)
                 if proyectos:
                     hay_datos = True
                     proyecto_names = ", ".join([f"{p.nombre} ({p.estado})" for p in proyectos])
@@ -301,7 +322,7 @@ class GeneradorInformes:
                     writer.writerow(['RUT Empleado', 'Nombre', 'Proyectos Asignados'])
                     
                     for emp in empleados:
-                        proyectos = Proyecto.obtener_proyectos_empleado(emp.rut)
+                        proyectos = self._proyectos_empleado(emp.rut)
                         if proyectos:
                             proyecto_names = ", ".join([f"{p.nombre} ({p.estado})" for p in proyectos])
                             writer.writerow([emp.rut, emp.nombre + ' ' + emp.apellido, proyecto_names])
@@ -13,10 +13,11 @@ from database.conexion import create_table_empleados, create_table_departamentos
 from models.empleado import Empleado
 from models.departamento import Departamento
 from models.registro_tiempo import RegistroTiempo
-from models.proyecto import Proyecto
+from models.proyecto import Proyecto, ProyectoError
 from informes import GeneradorInformes
 from seguridad import Autenticacion, ControlAcceso
 from datetime import datetime
+import logging
 
 
 def mostrar_menu():
@@ -453,7 +454,7 @@ def buscar_registros_empleado():
         print(f"[ERROR] Empleado con RUT {empleado_rut} no encontrado")
         return
     
-    registros = RegistroTiempo.leer_por_empleado(empleado_rut)
+    registros = list(RegistroTiempo.leer_por_empleado(empleado_rut))
     
     if not registros:
         print(f"[WARN] No hay registros de tiempo para {empleado.nombre} {empleado.apellido}")
@@ -474,7 +475,7 @@ def buscar_registros_empleado():
 def listar_registros_tiempo():
     """Listar todos los registros de tiempo."""
     print("\n--- LISTADO DE REGISTROS DE TIEMPO ---")
-    registros = RegistroTiempo.listar_todos()
+    registros = list(RegistroTiempo.listar_todos())
     
     if not registros:
         print("[WARN] No hay registros de tiempo registrados")
@@ -504,7 +505,7 @@ def buscar_registros_proyecto():
         print("[ERROR] El proyecto no puede estar vacío")
         return
     
-    registros = RegistroTiempo.leer_por_proyecto(proyecto)
+    registros = list(RegistroTiempo.leer_por_proyecto(proyecto))
     
     if not registros:
         print(f"[WARN] No hay registros para el proyecto '{proyecto}'")
@@ -662,6 +663,9 @@ def crear_proyecto():
         
         proyecto = Proyecto(nombre, descripcion, fecha_inicio)
         proyecto.crear()
+        print(f"[OK] Proyecto '{proyecto.nombre}' creado exitosamente")
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
     except ValueError as e:
         print(f"[ERROR] Error de validación: {e}")
     except Exception as e:
@@ -678,6 +682,8 @@ def buscar_proyecto_id():
             print(f"\n{proyecto}")
             if proyecto.descripcion:
                 print(f"Descripción: {proyecto.descripcion}")
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
     except ValueError:
         print("[ERROR] ID inválido. Debe ser un número.")
     except Exception as e:
@@ -688,17 +694,24 @@ def buscar_proyecto_nombre():
     """Buscar proyecto por nombre."""
     print("\n--- BUSCAR PROYECTO POR NOMBRE ---")
     nombre = input("Ingrese nombre del proyecto: ").strip()
-    proyecto = Proyecto.leer_por_nombre(nombre)
-    if proyecto:
-        print(f"\n{proyecto}")
-        if proyecto.descripcion:
-            print(f"Descripción: {proyecto.descripcion}")
+    try:
+        proyecto = Proyecto.leer_por_nombre(nombre)
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
+        return
+    print(f"\n{proyecto}")
+    if proyecto.descripcion:
+        print(f"Descripción: {proyecto.descripcion}")
 
 
 def listar_proyectos():
     """Listar todos los proyectos."""
     print("\n--- LISTADO DE PROYECTOS ---")
-    proyectos = Proyecto.listar_todos()
+    try:
+        proyectos = Proyecto.listar_todos()
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
+        return
     
     if not proyectos:
         print("[WARN] No hay proyectos registrados")
@@ -744,6 +757,9 @@ def actualizar_proyecto():
             proyecto.estado = estado
         
         proyecto.actualizar()
+        print("[OK] Proyecto actualizado exitosamente")
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
     except ValueError:
         print("[ERROR] ID inválido. Debe ser un número.")
     except Exception as e:
@@ -763,8 +779,11 @@ def eliminar_proyecto():
         confirmacion = input(f"¿Está seguro de eliminar '{proyecto.nombre}'? (s/n): ").lower()
         if confirmacion == 's':
             Proyecto.eliminar(id_proyecto)
+            print("[OK] Proyecto eliminado exitosamente")
         else:
             print("[WARN] Operación cancelada")
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
     except ValueError:
         print("[ERROR] ID inválido. Debe ser un número.")
     except Exception as e:
@@ -786,7 +805,11 @@ def asignar_empleado_proyecto():
     print(f"[OK] Empleado: {empleado.nombre} {empleado.apellido}")
     
     # Listar proyectos disponibles
-    proyectos = Proyecto.listar_todos()
+    try:
+        proyectos = Proyecto.listar_todos()
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
+        return
     
     if not proyectos:
         print("[WARN] No hay proyectos disponibles")
@@ -808,6 +831,8 @@ def asignar_empleado_proyecto():
         # Asignar empleado
         if Proyecto.asignar_empleado(empleado_rut, id_proyecto):
             print(f"[OK] {empleado.nombre} asignado a '{proyecto.nombre}'")
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
     except ValueError:
         print("[ERROR] ID inválido. Debe ser un número.")
 
@@ -827,7 +852,11 @@ def desasignar_empleado_proyecto():
     print(f"[OK] Empleado: {empleado.nombre} {empleado.apellido}")
     
     # Obtener proyectos del empleado
-    proyectos = Proyecto.obtener_proyectos_empleado(empleado_rut)
+    try:
+        proyectos = Proyecto.obtener_proyectos_empleado(empleado_rut)
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
+        return
     
     if not proyectos:
         print("[WARN] El empleado no está asignado a ningún proyecto")
@@ -843,6 +872,8 @@ def desasignar_empleado_proyecto():
         if Proyecto.desasignar_empleado(empleado_rut, id_proyecto):
             proyecto = Proyecto.leer_por_id(id_proyecto)
             print(f"[OK] {empleado.nombre} desasignado de '{proyecto.nombre}'")
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
     except ValueError:
         print("[ERROR] ID inválido. Debe ser un número.")
 
@@ -874,6 +905,8 @@ def ver_empleados_proyecto():
             print(f"   Salario: ${emp['salario']:,.0f}")
             if emp['id_departamento']:
                 print(f"   Departamento: {dept_info}")
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
     except ValueError:
         print("[ERROR] ID inválido. Debe ser un número.")
 
@@ -889,7 +922,11 @@ def ver_proyectos_empleado():
         print(f"[ERROR] Empleado con RUT {empleado_rut} no encontrado")
         return
     
-    proyectos = Proyecto.obtener_proyectos_empleado(empleado_rut)
+    try:
+        proyectos = Proyecto.obtener_proyectos_empleado(empleado_rut)
+    except ProyectoError as e:
+        print(f"[ERROR] {e}")
+        return
     
     if not proyectos:
         print(f"[WARN] {empleado.nombre} {empleado.apellido} no está asignado a ningún proyecto")
@@ -1087,11 +1124,8 @@ def main():
         opcion = input("\nSeleccione una opción: ").strip()
         
         # Verificar permisos según la opción
-        if opcion == '1' and not control.verificar_permiso('crear_empleado'):
-            continue
-        elif opcion == '6' and not control.verificar_permiso('eliminar_empleado'):
-            continue
-        elif opcion == '10' and not control.verificar_permiso('ver_informes'):
+        accion = {'1': 'crear_empleado', '6': 'eliminar_empleado', '10': 'ver_informes'}.get(opcion)
+        if accion and not control.verificar_permiso(accion):
             continue
         
         if opcion == '1':
@@ -1123,4 +1157,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # seguridad y models informan sus errores con logging: sin esta configuración
+    # no se vería nada en consola (por ejemplo, una caída de la BD durante el login).
+    # Uso el mismo formato "[NIVEL] mensaje" que los print del resto de la aplicación.
+    logging.basicConfig(level=logging.WARNING, format="[%(levelname)s] %(message)s")
     main()
\ No newline at end of file
@@ -1,7 +1,14 @@
 # Este archivo permite que 'models' sea un paquete de Python
+import logging
+
 from .empleado import Empleado
 from .departamento import Departamento
 from .registro_tiempo import RegistroTiempo
-from .proyecto import Proyecto
+from .proyecto import Proyecto, ProyectoError, DuplicateNameError, NotFoundError, DBError
+
+# Los modelos registran sus errores con logging; sin configuración explícita
+# de la aplicación no se emite nada por consola.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-__all__ = ['Empleado', 'Departamento', 'RegistroTiempo', 'Proyecto']
\ No newline at end of file
+__all__ = ['Empleado', 'Departamento', 'RegistroTiempo', 'Proyecto',
+           'ProyectoError', 'DuplicateNameError', 'NotFoundError', 'DBError']
\ No newline at end of file
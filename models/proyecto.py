@@ -1,10 +1,138 @@
+import logging
 from datetime import datetime
-from database.conexion import get_connection
+from database.conexion import (get_async_pool, transaction, current_connection,
+                               commit_outside_transaction, MAX_BINDS_IN, ORA_UNIQUE,
+                               ORA_FK_PADRE)
 import oracledb
 
 # Este módulo maneja los proyectos del sistema. Cada proyecto puede tener múltiples empleados
 # asignados (relación N:N a través de la tabla empleado_proyecto). Aquí implementé
 # la lógica para crear proyectos, asignar empleados, y cambiar estados de proyecto.
+# Los errores se informan al llamador con excepciones propias (ProyectoError y
+# subclases) en vez de imprimirse y retornar False/None. Como el llamador ya muestra
+# el mensaje de la excepción, aquí solo se registran con logging a nivel DEBUG.
+
+logger = logging.getLogger(__name__)
+
+# Sentencias SQL definidas una sola vez a nivel de módulo. Cada método las prepara
+# con cur.prepare() y ejecuta con cur.execute(None, binds); como el texto es siempre
+# el mismo objeto, Oracle lo encuentra en la caché de sentencias y se salta el parseo.
+_SQL_INSERT_PROYECTO = """
+    INSERT INTO proyectos 
+    (nombre, descripcion, fecha_inicio, estado)
+    VALUES (:p_nombre, :p_desc, :p_fecha, :p_estado)
+"""
+
+_SQL_SELECT_POR_ID = """
+    SELECT id_proyecto, nombre, descripcion, fecha_inicio, estado
+    FROM proyectos
+    WHERE id_proyecto = :id
+"""
+
+# Se completa con los placeholders (:id0, :id1, ...) de cada lote en leer_por_ids()
+_SQL_SELECT_POR_IDS = """
+    SELECT id_proyecto, nombre, descripcion, fecha_inicio, estado
+    FROM proyectos
+    WHERE id_proyecto IN ({placeholders})
+"""
+
+_SQL_SELECT_POR_NOMBRE = """
+    SELECT id_proyecto, nombre, descripcion, fecha_inicio, estado
+    FROM proyectos
+    WHERE UPPER(nombre) = UPPER(:nombre)
+"""
+
+_SQL_SELECT_TODOS = """
+    SELECT id_proyecto, nombre, descripcion, fecha_inicio, estado
+    FROM proyectos
+    ORDER BY fecha_inicio DESC
+"""
+
+_SQL_SELECT_POR_ESTADO = """
+    SELECT id_proyecto, nombre, descripcion, fecha_inicio, estado
+    FROM proyectos
+    WHERE estado = :estado
+    ORDER BY fecha_inicio DESC
+"""
+
+# Variantes paginadas (Oracle 12c+): solo viaja por la red la página pedida.
+# Las *_DESDE saltan offset filas y traen el resto (offset sin limit).
+_DESDE = "    OFFSET :p_offset ROWS\n"
+_PAGINACION = "    OFFSET :p_offset ROWS FETCH NEXT :p_limit ROWS ONLY\n"
+_SQL_SELECT_TODOS_DESDE = _SQL_SELECT_TODOS + _DESDE
+_SQL_SELECT_TODOS_PAGINA = _SQL_SELECT_TODOS + _PAGINACION
+_SQL_SELECT_POR_ESTADO_DESDE = _SQL_SELECT_POR_ESTADO + _DESDE
+_SQL_SELECT_POR_ESTADO_PAGINA = _SQL_SELECT_POR_ESTADO + _PAGINACION
+
+_SQL_CONTAR = "SELECT COUNT(*) FROM proyectos"
+
+_SQL_CONTAR_POR_ESTADO = "SELECT COUNT(*) FROM proyectos WHERE estado = :estado"
+
+_SQL_UPDATE_PROYECTO = """
+    UPDATE proyectos
+    SET nombre = :p_nombre,
+        descripcion = :p_desc,
+        fecha_inicio = :p_fecha,
+        estado = :p_estado
+    WHERE id_proyecto = :p_id
+"""
+
+_SQL_DELETE_ASIGNACIONES_PROYECTO = "DELETE FROM empleado_proyecto WHERE id_proyecto = :id"
+
+_SQL_DELETE_PROYECTO = "DELETE FROM proyectos WHERE id_proyecto = :id"
+
+_SQL_EXISTE_EMPLEADO = "SELECT rut FROM empleados WHERE rut = :rut"
+
+_SQL_EXISTE_PROYECTO = "SELECT id_proyecto FROM proyectos WHERE id_proyecto = :id"
+
+_SQL_INSERT_ASIGNACION = """
+    INSERT INTO empleado_proyecto (empleado_rut, id_proyecto)
+    VALUES (:rut, :id)
+"""
+
+_SQL_DELETE_ASIGNACION = """
+    DELETE FROM empleado_proyecto 
+    WHERE empleado_rut = :rut AND id_proyecto = :id
+"""
+
+_SQL_EMPLEADOS_PROYECTO = """
+    SELECT e.rut, e.nombre, e.apellido, e.cargo, e.salario, e.id_departamento
+    FROM empleados e
+    INNER JOIN empleado_proyecto ep ON e.rut = ep.empleado_rut
+    WHERE ep.id_proyecto = :id
+    ORDER BY e.nombre
+"""
+
+_SQL_PROYECTOS_EMPLEADO = """
+    SELECT p.id_proyecto, p.nombre, p.descripcion, p.fecha_inicio, p.estado
+    FROM proyectos p
+    INNER JOIN empleado_proyecto ep ON p.id_proyecto = ep.id_proyecto
+    WHERE ep.empleado_rut = :rut
+    ORDER BY p.fecha_inicio DESC
+"""
+
+
+def _codigo_error(e):
+    """Retorna el código ORA-xxxxx de un oracledb.DatabaseError (o None)."""
+    error = e.args[0] if e.args else None
+    return getattr(error, "code", None)
+
+
+class ProyectoError(Exception):
+    """Error base para las operaciones sobre proyectos."""
+
+
+class DuplicateNameError(ProyectoError):
+    """Ya existe un registro con el mismo nombre (o asignación duplicada)."""
+
+
+class NotFoundError(ProyectoError):
+    """El proyecto, empleado o asignación solicitada no existe."""
+
+
+class DBError(ProyectoError):
+    """Error inesperado de la base de datos."""
+
 
 class Proyecto:
     """
@@ -13,7 +141,13 @@ class Proyecto:
     También maneja la asignación de empleados a proyectos.
     """
     
-    def __init__(self, nombre, descripcion, fecha_inicio, estado="Activo", id_proyecto=None):
+    # Uso __slots__ porque listar_todos() crea un objeto por fila; sin __dict__
+    # cada instancia ocupa bastante menos memoria y el acceso a atributos es más rápido.
+    __slots__ = ('_id_proyecto', '_nombre', '_descripcion', '_fecha_inicio',
+                 '_estado', '_fecha_creacion')
+    
+    def __init__(self, nombre, descripcion, fecha_inicio, estado="Activo", id_proyecto=None,
+                 fecha_creacion=None):
         """
         Inicializa un objeto Proyecto.
         
@@ -23,13 +157,19 @@ class Proyecto:
             fecha_inicio (datetime): Fecha de inicio del proyecto
             estado (str, optional): Estado del proyecto (Activo/Pausado/Finalizado)
             id_proyecto (int, optional): ID del proyecto (usado al leer de BD)
+            fecha_creacion (datetime, optional): Fecha de creación (usado al leer de BD)
         """
         self._id_proyecto = id_proyecto
         self._nombre = nombre
         self._descripcion = descripcion or ""
         self._fecha_inicio = fecha_inicio
         self._estado = estado
-        self._fecha_creacion = datetime.now()
+        # Solo llamo a datetime.now() para proyectos nuevos. Al reconstruir
+        # objetos desde la BD (listar_todos con miles de filas) no tiene sentido
+        # pedir la hora actual por cada fila.
+        if fecha_creacion is None and id_proyecto is None:
+            fecha_creacion = datetime.now()
+        self._fecha_creacion = fecha_creacion
     
     @property
     def id_proyecto(self):
@@ -68,7 +208,8 @@ class Proyecto:
         """Establece la fecha de inicio del proyecto"""
         if isinstance(valor, str):
             try:
-                valor = datetime.strptime(valor, "%Y-%m-%d")
+                # fromisoformat es mucho más rápido que strptime y acepta YYYY-MM-DD
+                valor = datetime.fromisoformat(valor)
             except ValueError:
                 raise ValueError("Formato de fecha inválido. Use YYYY-MM-DD")
         if not isinstance(valor, datetime):
@@ -95,36 +236,38 @@ class Proyecto:
         Inserta el proyecto en la base de datos.
         
         Aquí valido que no exista otro proyecto con el mismo nombre (UNIQUE constraint).
-        Convierto la fecha de datetime a string para pasarla a Oracle con TO_DATE().
+        La fecha se enlaza directamente como datetime; oracledb la convierte a DATE
+        sin pasar por un string ni por TO_DATE().
         Cualquier error de BD (nombre duplicado, datos inválidos, etc) lo capturo
-        y le informo al usuario qué pasó.
+        y lo relanzo como una excepción de este módulo.
         
         Returns:
-            bool: True si se creó exitosamente, False en caso contrario
+            bool: True si se creó exitosamente
+            
+        Raises:
+            DuplicateNameError: Si ya existe un proyecto con el mismo nombre
+            DBError: Si ocurre otro error de base de datos
         """
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    fecha_str = self._fecha_inicio.strftime("%Y-%m-%d")
-                    cur.execute("""
-                        INSERT INTO proyectos 
-                        (nombre, descripcion, fecha_inicio, estado)
-                        VALUES (:p_nombre, :p_desc, TO_DATE(:p_fecha, 'YYYY-MM-DD'), :p_estado)
-                    """, {
+                    cur.prepare(_SQL_INSERT_PROYECTO)
+                    cur.execute(None, {
                         "p_nombre": self._nombre,
                         "p_desc": self._descripcion,
-                        "p_fecha": fecha_str,
+                        "p_fecha": self._fecha_inicio,
                         "p_estado": self._estado
                     })
-                    conn.commit()
-                    print(f"[OK] Proyecto '{self._nombre}' creado exitosamente")
+                    commit_outside_transaction(conn)
+                    logger.info("Proyecto '%s' creado exitosamente", self._nombre)
                     return True
         except oracledb.DatabaseError as e:
-            if "UNIQUE constraint" in str(e):
-                print(f"[ERROR] Ya existe un proyecto con el nombre '{self._nombre}'")
-            else:
-                print(f"[ERROR] Error al crear proyecto: {e}")
-            return False
+            if _codigo_error(e) == ORA_UNIQUE:
+                logger.debug("Ya existe un proyecto con el nombre '%s'", self._nombre)
+                raise DuplicateNameError(
+                    f"Ya existe un proyecto con el nombre '{self._nombre}'") from e
+            logger.debug("Error al crear proyecto: %s", e)
+            raise DBError(f"Error al crear proyecto: {e}") from e
     
     @staticmethod
     def leer_por_id(id_proyecto):
@@ -136,28 +279,60 @@ class Proyecto:
             
         Returns:
             Proyecto: Objeto con los datos del proyecto, None si no existe
+            
+        Raises:
+            DBError: Si ocurre un error de base de datos
         """
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id_proyecto, nombre, descripcion, fecha_inicio, estado
-                        FROM proyectos
-                        WHERE id_proyecto = :id
-                    """, {"id": id_proyecto})
+                    cur.prepare(_SQL_SELECT_POR_ID)
+                    cur.execute(None, {"id": id_proyecto})
                     row = cur.fetchone()
                     if row:
-                        return Proyecto.crear_desde_dict({
-                            'id_proyecto': row[0],
-                            'nombre': row[1],
-                            'descripcion': row[2],
-                            'fecha_inicio': row[3],
-                            'estado': row[4]
-                        })
+                        return Proyecto._from_row(row)
                     return None
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al buscar proyecto: {e}")
-            return None
+            logger.debug("Error al buscar proyecto: %s", e)
+            raise DBError(f"Error al buscar proyecto: {e}") from e
+    
+    @staticmethod
+    def leer_por_ids(ids):
+        """
+        Busca varios proyectos por ID con una sola consulta (por lote) en vez de
+        llamar leer_por_id() una vez por cada ID. Útil para pantallas o informes
+        que necesitan muchos proyectos a la vez.
+        Los IDs repetidos se consultan una sola vez y las listas grandes se dividen
+        en lotes de 1000 para respetar el límite de Oracle en las listas IN.
+        
+        Args:
+            ids (iterable): IDs de los proyectos a buscar
+            
+        Returns:
+            dict: {id_proyecto: Proyecto} con los proyectos encontrados
+            
+        Raises:
+            DBError: Si ocurre un error de base de datos
+        """
+        ids_unicos = list(dict.fromkeys(ids))
+        proyectos = {}
+        if not ids_unicos:
+            return proyectos
+        
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    for inicio in range(0, len(ids_unicos), MAX_BINDS_IN):
+                        lote = ids_unicos[inicio:inicio + MAX_BINDS_IN]
+                        placeholders = ", ".join(f":id{i}" for i in range(len(lote)))
+                        cur.execute(_SQL_SELECT_POR_IDS.format(placeholders=placeholders),
+                                    {f"id{i}": valor for i, valor in enumerate(lote)})
+                        for row in cur:
+                            proyectos[row[0]] = Proyecto._from_row(row)
+        except oracledb.DatabaseError as e:
+            logger.debug("Error al buscar proyectos por ID: %s", e)
+            raise DBError(f"Error al buscar proyectos por ID: {e}") from e
+        return proyectos
     
     @staticmethod
     def leer_por_nombre(nombre):
@@ -168,136 +343,185 @@ class Proyecto:
             nombre (str): Nombre del proyecto a buscar
             
         Returns:
-            Proyecto: Objeto con los datos del proyecto, None si no existe
+            Proyecto: Objeto con los datos del proyecto
+            
+        Raises:
+            NotFoundError: Si no existe un proyecto con ese nombre
+            DBError: Si ocurre un error de base de datos
         """
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id_proyecto, nombre, descripcion, fecha_inicio, estado
-                        FROM proyectos
-                        WHERE UPPER(nombre) = UPPER(:nombre)
-                    """, {"nombre": nombre})
+                    cur.prepare(_SQL_SELECT_POR_NOMBRE)
+                    cur.execute(None, {"nombre": nombre})
                     row = cur.fetchone()
                     if row:
-                        return Proyecto.crear_desde_dict({
-                            'id_proyecto': row[0],
-                            'nombre': row[1],
-                            'descripcion': row[2],
-                            'fecha_inicio': row[3],
-                            'estado': row[4]
-                        })
-                    print(f"[ERROR] Proyecto '{nombre}' no encontrado")
-                    return None
+                        return Proyecto._from_row(row)
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al buscar proyecto: {e}")
-            return None
+            logger.debug("Error al buscar proyecto: %s", e)
+            raise DBError(f"Error al buscar proyecto: {e}") from e
+        logger.debug("Proyecto '%s' no encontrado", nombre)
+        raise NotFoundError(f"Proyecto '{nombre}' no encontrado")
     
     @staticmethod
-    def listar_todos():
+    def listar_todos(offset=0, limit=None):
         """
-        Obtiene todos los proyectos.
+        Obtiene todos los proyectos, o solo una página si se indica limit.
         
+        Args:
+            offset (int, optional): Cantidad de proyectos a saltar
+            limit (int, optional): Máximo de proyectos a retornar (al menos 1); None para todos
+            
         Returns:
             list: Lista de objetos Proyecto
+            
+        Raises:
+            ValueError: Si limit es menor que 1 o offset es negativo
+            DBError: Si ocurre un error de base de datos
         """
         proyectos = []
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id_proyecto, nombre, descripcion, fecha_inicio, estado
-                        FROM proyectos
-                        ORDER BY fecha_inicio DESC
-                    """)
-                    for row in cur.fetchall():
-                        proyectos.append(Proyecto.crear_desde_dict({
-                            'id_proyecto': row[0],
-                            'nombre': row[1],
-                            'descripcion': row[2],
-                            'fecha_inicio': row[3],
-                            'estado': row[4]
-                        }))
+                    for row in Proyecto._consultar_pagina(
+                            cur, _SQL_SELECT_TODOS, _SQL_SELECT_TODOS_DESDE,
+                            _SQL_SELECT_TODOS_PAGINA, {}, offset, limit):
+                        proyectos.append(Proyecto._from_row(row))
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al listar proyectos: {e}")
+            logger.debug("Error al listar proyectos: %s", e)
+            raise DBError(f"Error al listar proyectos: {e}") from e
         return proyectos
     
     @staticmethod
-    def listar_por_estado(estado):
+    def listar_por_estado(estado, offset=0, limit=None):
         """
-        Obtiene todos los proyectos con un estado específico.
+        Obtiene todos los proyectos con un estado específico, o solo una página
+        si se indica limit.
         
         Args:
             estado (str): Estado del proyecto (Activo/Pausado/Finalizado)
+            offset (int, optional): Cantidad de proyectos a saltar
+            limit (int, optional): Máximo de proyectos a retornar (al menos 1); None para todos
             
         Returns:
             list: Lista de objetos Proyecto
+            
+        Raises:
+            ValueError: Si limit es menor que 1 o offset es negativo
+            DBError: Si ocurre un error de base de datos
         """
         proyectos = []
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id_proyecto, nombre, descripcion, fecha_inicio, estado
-                        FROM proyectos
-                        WHERE estado = :estado
-                        ORDER BY fecha_inicio DESC
-                    """, {"estado": estado})
-                    for row in cur.fetchall():
-                        proyectos.append(Proyecto.crear_desde_dict({
-                            'id_proyecto': row[0],
-                            'nombre': row[1],
-                            'descripcion': row[2],
-                            'fecha_inicio': row[3],
-                            'estado': row[4]
-                        }))
+                    for row in Proyecto._consultar_pagina(
+                            cur, _SQL_SELECT_POR_ESTADO, _SQL_SELECT_POR_ESTADO_DESDE,
+                            _SQL_SELECT_POR_ESTADO_PAGINA, {"estado": estado}, offset, limit):
+                        proyectos.append(Proyecto._from_row(row))
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al listar proyectos por estado: {e}")
+            logger.debug("Error al listar proyectos por estado: %s", e)
+            raise DBError(f"Error al listar proyectos por estado: {e}") from e
         return proyectos
     
+    @staticmethod
+    def contar(estado=None):
+        """
+        Cuenta los proyectos (opcionalmente solo los de un estado).
+        Lo uso junto con la paginación de listar_todos()/listar_por_estado()
+        para saber cuántas páginas hay sin traer las filas.
+        
+        Args:
+            estado (str, optional): Estado del proyecto (Activo/Pausado/Finalizado)
+            
+        Returns:
+            int: Cantidad de proyectos
+            
+        Raises:
+            DBError: Si ocurre un error de base de datos
+        """
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    if estado is None:
+                        cur.prepare(_SQL_CONTAR)
+                        cur.execute(None)
+                    else:
+                        cur.prepare(_SQL_CONTAR_POR_ESTADO)
+                        cur.execute(None, {"estado": estado})
+                    return cur.fetchone()[0]
+        except oracledb.DatabaseError as e:
+            logger.debug("Error al contar proyectos: %s", e)
+            raise DBError(f"Error al contar proyectos: {e}") from e
+    
+    @staticmethod
+    def _consultar_pagina(cur, sql, sql_desde, sql_pagina, binds, offset, limit):
+        """
+        Ejecuta una consulta de listado completa o paginada y retorna sus filas.
+        Con limit uso la variante OFFSET/FETCH NEXT y fetchmany(limit), ajustando
+        arraysize para traer la página en un solo viaje de red. Con offset y sin
+        limit uso la variante que solo salta filas (OFFSET ... ROWS).
+        """
+        if offset < 0:
+            raise ValueError("offset no puede ser negativo")
+        if limit is not None and limit < 1:
+            raise ValueError("limit debe ser al menos 1")
+        if limit is None:
+            if offset:
+                cur.prepare(sql_desde)
+                cur.execute(None, dict(binds, p_offset=offset))
+            else:
+                cur.prepare(sql)
+                cur.execute(None, binds)
+            return cur.fetchall()
+        cur.arraysize = limit
+        cur.prepare(sql_pagina)
+        cur.execute(None, dict(binds, p_offset=offset, p_limit=limit))
+        return cur.fetchmany(limit)
+    
     def actualizar(self):
         """
         Actualiza el proyecto en la base de datos.
         
         Returns:
-            bool: True si se actualizó exitosamente, False en caso contrario
+            bool: True si se actualizó exitosamente
+            
+        Raises:
+            ProyectoError: Si el proyecto no tiene ID
+            NotFoundError: Si no existe un proyecto con ese ID
+            DuplicateNameError: Si ya existe otro proyecto con el mismo nombre
+            DBError: Si ocurre otro error de base de datos
         """
         if not self._id_proyecto:
-            print("[ERROR] No se puede actualizar un proyecto sin ID")
-            return False
+            logger.debug("No se puede actualizar un proyecto sin ID")
+            raise ProyectoError("No se puede actualizar un proyecto sin ID")
         
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    fecha_str = self._fecha_inicio.strftime("%Y-%m-%d")
-                    cur.execute("""
-                        UPDATE proyectos
-                        SET nombre = :p_nombre,
-                            descripcion = :p_desc,
-                            fecha_inicio = TO_DATE(:p_fecha, 'YYYY-MM-DD'),
-                            estado = :p_estado
-                        WHERE id_proyecto = :p_id
-                    """, {
+                    cur.prepare(_SQL_UPDATE_PROYECTO)
+                    cur.execute(None, {
                         "p_nombre": self._nombre,
                         "p_desc": self._descripcion,
-                        "p_fecha": fecha_str,
+                        "p_fecha": self._fecha_inicio,
                         "p_estado": self._estado,
                         "p_id": self._id_proyecto
                     })
                     
                     if cur.rowcount == 0:
-                        print(f"[ERROR] No se encontró proyecto con ID {self._id_proyecto}")
-                        return False
+                        logger.debug("No se encontró proyecto con ID %s", self._id_proyecto)
+                        raise NotFoundError(
+                            f"No se encontró proyecto con ID {self._id_proyecto}")
                     
-                    conn.commit()
-                    print(f"[OK] Proyecto actualizado exitosamente")
+                    commit_outside_transaction(conn)
+                    logger.info("Proyecto %s actualizado exitosamente", self._id_proyecto)
                     return True
         except oracledb.DatabaseError as e:
-            if "UNIQUE constraint" in str(e):
-                print(f"[ERROR] Ya existe otro proyecto con el nombre '{self._nombre}'")
-            else:
-                print(f"[ERROR] Error al actualizar proyecto: {e}")
-            return False
+            if _codigo_error(e) == ORA_UNIQUE:
+                logger.debug("Ya existe otro proyecto con el nombre '%s'", self._nombre)
+                raise DuplicateNameError(
+                    f"Ya existe otro proyecto con el nombre '{self._nombre}'") from e
+            logger.debug("Error al actualizar proyecto: %s", e)
+            raise DBError(f"Error al actualizar proyecto: {e}") from e
     
     @staticmethod
     def eliminar(id_proyecto):
@@ -308,29 +532,33 @@ class Proyecto:
             id_proyecto (int): ID del proyecto a eliminar
             
         Returns:
-            bool: True si se eliminó exitosamente, False en caso contrario
+            bool: True si se eliminó exitosamente
+            
+        Raises:
+            NotFoundError: Si no existe un proyecto con ese ID
+            DBError: Si ocurre un error de base de datos
         """
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
                     # Primero, eliminar asignaciones de empleados al proyecto
-                    cur.execute("DELETE FROM empleado_proyecto WHERE id_proyecto = :id", 
-                               {"id": id_proyecto})
+                    cur.prepare(_SQL_DELETE_ASIGNACIONES_PROYECTO)
+                    cur.execute(None, {"id": id_proyecto})
                     
                     # Luego, eliminar el proyecto
-                    cur.execute("DELETE FROM proyectos WHERE id_proyecto = :id", 
-                               {"id": id_proyecto})
+                    cur.prepare(_SQL_DELETE_PROYECTO)
+                    cur.execute(None, {"id": id_proyecto})
                     
                     if cur.rowcount == 0:
-                        print(f"[ERROR] No se encontró proyecto con ID {id_proyecto}")
-                        return False
+                        logger.debug("No se encontró proyecto con ID %s", id_proyecto)
+                        raise NotFoundError(f"No se encontró proyecto con ID {id_proyecto}")
                     
-                    conn.commit()
-                    print(f"[OK] Proyecto eliminado exitosamente")
+                    commit_outside_transaction(conn)
+                    logger.info("Proyecto %s eliminado exitosamente", id_proyecto)
                     return True
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al eliminar proyecto: {e}")
-            return False
+            logger.debug("Error al eliminar proyecto: %s", e)
+            raise DBError(f"Error al eliminar proyecto: {e}") from e
     
     @staticmethod
     def asignar_empleado(empleado_rut, id_proyecto):
@@ -342,39 +570,47 @@ class Proyecto:
             id_proyecto (int): ID del proyecto
             
         Returns:
-            bool: True si se asignó exitosamente, False en caso contrario
+            bool: True si se asignó exitosamente
+            
+        Raises:
+            NotFoundError: Si el empleado o el proyecto no existen
+            DuplicateNameError: Si el empleado ya está asignado al proyecto
+            DBError: Si ocurre otro error de base de datos
         """
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
                     # Verificar que empleado existe
-                    cur.execute("SELECT rut FROM empleados WHERE rut = :rut", 
-                               {"rut": empleado_rut})
+                    cur.prepare(_SQL_EXISTE_EMPLEADO)
+                    cur.execute(None, {"rut": empleado_rut})
                     if not cur.fetchone():
-                        print(f"[ERROR] Empleado con RUT {empleado_rut} no existe")
-                        return False
+                        logger.debug("Empleado con RUT %s no existe", empleado_rut)
+                        raise NotFoundError(f"Empleado con RUT {empleado_rut} no existe")
                     
                     # Verificar que proyecto existe
-                    cur.execute("SELECT id_proyecto FROM proyectos WHERE id_proyecto = :id", 
-                               {"id": id_proyecto})
+                    cur.prepare(_SQL_EXISTE_PROYECTO)
+                    cur.execute(None, {"id": id_proyecto})
                     if not cur.fetchone():
-                        print(f"[ERROR] Proyecto con ID {id_proyecto} no existe")
-                        return False
+                        logger.debug("Proyecto con ID %s no existe", id_proyecto)
+                        raise NotFoundError(f"Proyecto con ID {id_proyecto} no existe")
                     
                     # Asignar empleado a proyecto
-                    cur.execute("""
-                        INSERT INTO empleado_proyecto (empleado_rut, id_proyecto)
-                        VALUES (:rut, :id)
-                    """, {"rut": empleado_rut, "id": id_proyecto})
-                    conn.commit()
-                    print(f"[OK] Empleado asignado al proyecto exitosamente")
+                    cur.prepare(_SQL_INSERT_ASIGNACION)
+                    cur.execute(None, {"rut": empleado_rut, "id": id_proyecto})
+                    commit_outside_transaction(conn)
+                    logger.info("Empleado %s asignado al proyecto %s", empleado_rut, id_proyecto)
                     return True
         except oracledb.DatabaseError as e:
-            if "UNIQUE constraint" in str(e):
-                print(f"[ERROR] El empleado ya está asignado a este proyecto")
-            else:
-                print(f"[ERROR] Error al asignar empleado: {e}")
-            return False
+            if _codigo_error(e) == ORA_UNIQUE:
+                logger.debug("El empleado %s ya está asignado al proyecto %s",
+                             empleado_rut, id_proyecto)
+                raise DuplicateNameError("El empleado ya está asignado a este proyecto") from e
+            if _codigo_error(e) == ORA_FK_PADRE:
+                # El empleado o el proyecto se borró entre la verificación y el INSERT
+                logger.debug("Empleado %s o proyecto %s no existe", empleado_rut, id_proyecto)
+                raise NotFoundError("El empleado o el proyecto no existe") from e
+            logger.debug("Error al asignar empleado: %s", e)
+            raise DBError(f"Error al asignar empleado: {e}") from e
     
     @staticmethod
     def desasignar_empleado(empleado_rut, id_proyecto):
@@ -386,26 +622,29 @@ class Proyecto:
             id_proyecto (int): ID del proyecto
             
         Returns:
-            bool: True si se desasignó exitosamente, False en caso contrario
+            bool: True si se desasignó exitosamente
+            
+        Raises:
+            NotFoundError: Si la asignación no existe
+            DBError: Si ocurre un error de base de datos
         """
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        DELETE FROM empleado_proyecto 
-                        WHERE empleado_rut = :rut AND id_proyecto = :id
-                    """, {"rut": empleado_rut, "id": id_proyecto})
+                    cur.prepare(_SQL_DELETE_ASIGNACION)
+                    cur.execute(None, {"rut": empleado_rut, "id": id_proyecto})
                     
                     if cur.rowcount == 0:
-                        print(f"[ERROR] Asignación no encontrada")
-                        return False
+                        logger.debug("Asignación no encontrada: %s en proyecto %s",
+                                     empleado_rut, id_proyecto)
+                        raise NotFoundError("Asignación no encontrada")
                     
-                    conn.commit()
-                    print(f"[OK] Empleado desasignado del proyecto exitosamente")
+                    commit_outside_transaction(conn)
+                    logger.info("Empleado %s desasignado del proyecto %s", empleado_rut, id_proyecto)
                     return True
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al desasignar empleado: {e}")
-            return False
+            logger.debug("Error al desasignar empleado: %s", e)
+            raise DBError(f"Error al desasignar empleado: {e}") from e
     
     @staticmethod
     def obtener_empleados_proyecto(id_proyecto):
@@ -417,18 +656,16 @@ class Proyecto:
             
         Returns:
             list: Lista de RUTs de empleados asignados
+            
+        Raises:
+            DBError: Si ocurre un error de base de datos
         """
         empleados = []
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT e.rut, e.nombre, e.apellido, e.cargo, e.salario, e.id_departamento
-                        FROM empleados e
-                        INNER JOIN empleado_proyecto ep ON e.rut = ep.empleado_rut
-                        WHERE ep.id_proyecto = :id
-                        ORDER BY e.nombre
-                    """, {"id": id_proyecto})
+                    cur.prepare(_SQL_EMPLEADOS_PROYECTO)
+                    cur.execute(None, {"id": id_proyecto})
                     for row in cur.fetchall():
                         empleados.append({
                             'rut': row[0],
@@ -439,7 +676,8 @@ class Proyecto:
                             'id_departamento': row[5]
                         })
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al obtener empleados del proyecto: {e}")
+            logger.debug("Error al obtener empleados del proyecto: %s", e)
+            raise DBError(f"Error al obtener empleados del proyecto: {e}") from e
         return empleados
     
     @staticmethod
@@ -452,30 +690,154 @@ class Proyecto:
             
         Returns:
             list: Lista de objetos Proyecto
+            
+        Raises:
+            DBError: Si ocurre un error de base de datos
         """
         proyectos = []
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT p.id_proyecto, p.nombre, p.descripcion, p.fecha_inicio, p.estado
-                        FROM proyectos p
-                        INNER JOIN empleado_proyecto ep ON p.id_proyecto = ep.id_proyecto
-                        WHERE ep.empleado_rut = :rut
-                        ORDER BY p.fecha_inicio DESC
-                    """, {"rut": empleado_rut})
+                    cur.prepare(_SQL_PROYECTOS_EMPLEADO)
+                    cur.execute(None, {"rut": empleado_rut})
                     for row in cur.fetchall():
-                        proyectos.append(Proyecto.crear_desde_dict({
-                            'id_proyecto': row[0],
-                            'nombre': row[1],
-                            'descripcion': row[2],
-                            'fecha_inicio': row[3],
-                            'estado': row[4]
-                        }))
+                        proyectos.append(Proyecto._from_row(row))
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al obtener proyectos del empleado: {e}")
+            logger.debug("Error al obtener proyectos del empleado: %s", e)
+            raise DBError(f"Error al obtener proyectos del empleado: {e}") from e
         return proyectos
     
+    @staticmethod
+    async def leer_por_id_async(id_proyecto):
+        """
+        Versión asíncrona de leer_por_id().
+        Pensada para código que atiende muchas consultas a la vez: varias llamadas
+        pueden combinarse con asyncio.gather() y esperar la red en paralelo.
+        
+        Args:
+            id_proyecto (int): ID del proyecto a buscar
+            
+        Returns:
+            Proyecto: Objeto con los datos del proyecto, None si no existe
+            
+        Raises:
+            DBError: Si ocurre un error de base de datos
+        """
+        try:
+            async with get_async_pool().acquire() as conn:
+                with conn.cursor() as cur:
+                    cur.prepare(_SQL_SELECT_POR_ID)
+                    await cur.execute(None, {"id": id_proyecto})
+                    row = await cur.fetchone()
+                    return Proyecto._from_row(row) if row else None
+        except oracledb.DatabaseError as e:
+            logger.debug("Error al buscar proyecto: %s", e)
+            raise DBError(f"Error al buscar proyecto: {e}") from e
+    
+    @staticmethod
+    async def listar_todos_async():
+        """
+        Versión asíncrona de listar_todos().
+        
+        Returns:
+            list: Lista de objetos Proyecto
+            
+        Raises:
+            DBError: Si ocurre un error de base de datos
+        """
+        try:
+            async with get_async_pool().acquire() as conn:
+                with conn.cursor() as cur:
+                    cur.prepare(_SQL_SELECT_TODOS)
+                    await cur.execute(None)
+                    return [Proyecto._from_row(row) for row in await cur.fetchall()]
+        except oracledb.DatabaseError as e:
+            logger.debug("Error al listar proyectos: %s", e)
+            raise DBError(f"Error al listar proyectos: {e}") from e
+    
+    @staticmethod
+    async def listar_por_estado_async(estado):
+        """
+        Versión asíncrona de listar_por_estado().
+        
+        Args:
+            estado (str): Estado del proyecto (Activo/Pausado/Finalizado)
+            
+        Returns:
+            list: Lista de objetos Proyecto
+            
+        Raises:
+            DBError: Si ocurre un error de base de datos
+        """
+        try:
+            async with get_async_pool().acquire() as conn:
+                with conn.cursor() as cur:
+                    cur.prepare(_SQL_SELECT_POR_ESTADO)
+                    await cur.execute(None, {"estado": estado})
+                    return [Proyecto._from_row(row) for row in await cur.fetchall()]
+        except oracledb.DatabaseError as e:
+            logger.debug("Error al listar proyectos por estado: %s", e)
+            raise DBError(f"Error al listar proyectos por estado: {e}") from e
+    
+    @staticmethod
+    async def obtener_proyectos_empleado_async(empleado_rut):
+        """
+        Versión asíncrona de obtener_proyectos_empleado().
+        
+        Args:
+            empleado_rut (str): RUT del empleado
+            
+        Returns:
+            list: Lista de objetos Proyecto
+            
+        Raises:
+            DBError: Si ocurre un error de base de datos
+        """
+        try:
+            async with get_async_pool().acquire() as conn:
+                with conn.cursor() as cur:
+                    cur.prepare(_SQL_PROYECTOS_EMPLEADO)
+                    await cur.execute(None, {"rut": empleado_rut})
+                    return [Proyecto._from_row(row) for row in await cur.fetchall()]
+        except oracledb.DatabaseError as e:
+            logger.debug("Error al obtener proyectos del empleado: %s", e)
+            raise DBError(f"Error al obtener proyectos del empleado: {e}") from e
+    
+    @staticmethod
+    def _from_row(row):
+        """
+        Crea un Proyecto a partir de una fila (id_proyecto, nombre, descripcion,
+        fecha_inicio, estado) tal como la retornan las consultas de este módulo.
+        """
+        return Proyecto.crear_desde_dict({
+            'id_proyecto': row[0],
+            'nombre': row[1],
+            'descripcion': row[2],
+            'fecha_inicio': row[3],
+            'estado': row[4]
+        })
+    
+    @staticmethod
+    def transaction():
+        """
+        Agrupa varias operaciones de escritura en una sola transacción.
+        Es database.conexion.transaction(): los métodos de Proyecto (y también los de
+        RegistroTiempo) llamados dentro del bloque comparten la conexión y no hacen
+        commit por su cuenta; al salir se hace un único commit (o rollback si hubo
+        una excepción). Por ejemplo, crear un proyecto y asignarle 50 empleados
+        cuesta un commit en vez de 51.
+        
+        Uso:
+            with Proyecto.transaction():
+                proyecto.crear()
+                for rut in ruts:
+                    Proyecto.asignar_empleado(rut, id_proyecto)
+        
+        Returns:
+            Context manager que entrega la conexión usada por la transacción
+        """
+        return transaction()
+    
     @staticmethod
     def crear_desde_dict(data):
         """
@@ -486,23 +848,27 @@ class Proyecto:
             
         Returns:
             Proyecto: Objeto con los datos del diccionario
+            
+        Raises:
+            ProyectoError: Si los datos del diccionario no son válidos
         """
         try:
             # Convertir fecha si viene de la BD como objeto datetime
             fecha_inicio = data.get('fecha_inicio')
             if isinstance(fecha_inicio, str):
-                fecha_inicio = datetime.strptime(fecha_inicio, "%Y-%m-%d")
+                fecha_inicio = datetime.fromisoformat(fecha_inicio)
             
             return Proyecto(
                 nombre=data.get('nombre'),
                 descripcion=data.get('descripcion', ''),
                 fecha_inicio=fecha_inicio,
                 estado=data.get('estado', 'Activo'),
-                id_proyecto=data.get('id_proyecto')
+                id_proyecto=data.get('id_proyecto'),
+                fecha_creacion=data.get('fecha_creacion')
             )
         except (KeyError, ValueError) as e:
-            print(f"[ERROR] Error al crear Proyecto desde diccionario: {e}")
-            return None
+            logger.debug("Error al crear Proyecto desde diccionario: %s", e)
+            raise ProyectoError(f"Error al crear Proyecto desde diccionario: {e}") from e
     
     def __str__(self):
         """Representación legible del proyecto"""
@@ -516,7 +882,20 @@ class Proyecto:
                 f"estado={self._estado}, fecha_inicio={self._fecha_inicio})")
     
     def __eq__(self, otro):
-        """Compara dos proyectos por su ID"""
+        """
+        Compara dos proyectos por su ID.
+        Un proyecto sin guardar (id None) solo es igual a sí mismo.
+        """
         if not isinstance(otro, Proyecto):
             return False
+        if self._id_proyecto is None or otro._id_proyecto is None:
+            return self is otro
         return self._id_proyecto == otro._id_proyecto
+    
+    def __hash__(self):
+        """
+        Hash basado en el ID, coherente con __eq__, para poder usar proyectos en
+        sets o como llaves de dict. Los proyectos sin guardar comparten el hash
+        de None, pero como solo son iguales a sí mismos no se confunden entre sí.
+        """
+        return hash(self._id_proyecto)
@@ -1,17 +1,157 @@
+import re
 from datetime import datetime
-from database.conexion import get_connection
+from database.conexion import (transaction, current_connection, commit_outside_transaction,
+                               MAX_BINDS_IN, ORA_FK_PADRE)
 import oracledb
 
 # Este módulo representa los registros de tiempo que cada empleado trabaja.
 # Es crítico porque es donde se capturan las horas que trabajó cada empleado en cada proyecto.
 # Aquí fijé validaciones importantes: máximo 24 horas por día, mínimo 0.5 horas, etc.
 
+# Cantidad máxima de filas que envío a Oracle en cada executemany() de crear_muchos()
+_TAMANO_LOTE = 10000
+
+# Filas que trae cada viaje de red en las consultas de listado (arraysize)
+_FILAS_POR_VIAJE = 1000
+
+# Formato de RUT chileno: 7 u 8 dígitos, con o sin puntos de miles (12.345.678-9
+# es el formato que pide el menú), guion y dígito verificador (0-9 o K).
+# Lo compilo una sola vez al importar el módulo.
+_RUT_RE = re.compile(r"^\d{1,2}\.?\d{3}\.?\d{3}-[\dkK]$")
+
+# Sentencias SQL a nivel de módulo: el texto es siempre idéntico (mismos espacios),
+# así Oracle las encuentra en la caché de sentencias y no las vuelve a parsear.
+_SQL_INSERT = """
+    INSERT INTO registros_tiempo 
+    (empleado_rut, fecha_registro, horas, proyecto, descripcion)
+    VALUES (:p_rut, :p_fecha, :p_horas, :p_proyecto, :p_desc)
+    RETURNING id_registro INTO :p_id
+"""
+
+_SQL_INSERT_LOTE = """
+    INSERT INTO registros_tiempo 
+    (empleado_rut, fecha_registro, horas, proyecto, descripcion)
+    VALUES (:1, :2, :3, :4, :5)
+"""
+
+_SQL_SELECT_POR_ID = """
+    SELECT id_registro, empleado_rut, fecha_registro, horas, 
+           proyecto, descripcion
+    FROM registros_tiempo
+    WHERE id_registro = :id
+"""
+
+# Columnas de los listados. Con incluir_descripcion=False traigo NULL en lugar de
+# la descripción (VARCHAR2(500)), que es la columna más pesada de cada fila; así la
+# posición de las columnas no cambia y _from_row() sirve para ambos casos.
+# Esos objetos quedan con _descripcion = None (no cargada), que actualizar() y
+# upsert() distinguen de una descripción vacía para no sobrescribir la guardada.
+_COLUMNAS = {
+    True: "id_registro, empleado_rut, fecha_registro, horas, proyecto, descripcion",
+    False: "id_registro, empleado_rut, fecha_registro, horas, proyecto, NULL",
+}
+
+# Cada consulta de listado se arma una sola vez por variante (con y sin descripción)
+_SQL_SELECT_POR_EMPLEADO = {incluir: f"""
+    SELECT {columnas}
+    FROM registros_tiempo
+    WHERE empleado_rut = :rut
+    ORDER BY fecha_registro DESC
+""" for incluir, columnas in _COLUMNAS.items()}
+
+_SQL_SELECT_POR_PROYECTO = {incluir: f"""
+    SELECT {columnas}
+    FROM registros_tiempo
+    WHERE UPPER(proyecto) = UPPER(:proyecto)
+    ORDER BY fecha_registro DESC
+""" for incluir, columnas in _COLUMNAS.items()}
+
+_SQL_SELECT_TODOS = {incluir: f"""
+    SELECT {columnas}
+    FROM registros_tiempo
+    ORDER BY fecha_registro DESC
+""" for incluir, columnas in _COLUMNAS.items()}
+
+_SQL_SELECT_PAGINA = _SQL_SELECT_TODOS[True] + """    OFFSET :p_offset ROWS FETCH NEXT :p_limit ROWS ONLY
+"""
+
+_SQL_TOTAL_HORAS_EMPLEADO = """
+    SELECT NVL(SUM(horas), 0)
+    FROM registros_tiempo
+    WHERE empleado_rut = :rut
+"""
+
+_SQL_TOTAL_HORAS_PROYECTO = """
+    SELECT NVL(SUM(horas), 0)
+    FROM registros_tiempo
+    WHERE UPPER(proyecto) = UPPER(:proyecto)
+"""
+
+# Filtro por rango [inicio, fin) en vez de EXTRACT(YEAR/MONTH ...) para que Oracle
+# pueda usar el índice ix_regtime_fecha
+_SQL_HORAS_POR_EMPLEADO_MES = """
+    SELECT empleado_rut, SUM(horas)
+    FROM registros_tiempo
+    WHERE fecha_registro >= :p_inicio
+      AND fecha_registro < :p_fin
+    GROUP BY empleado_rut
+"""
+
+_SQL_IDS_POR_PROYECTO = """
+    SELECT id_registro
+    FROM registros_tiempo
+    WHERE UPPER(proyecto) = UPPER(:proyecto)
+    ORDER BY fecha_registro DESC
+"""
+
+# :p_con_desc = 0 cuando el objeto se leyó sin descripción: se conserva la guardada
+_SQL_UPDATE = """
+    UPDATE registros_tiempo
+    SET fecha_registro = :p_fecha,
+        horas = :p_horas,
+        proyecto = :p_proyecto,
+        descripcion = CASE WHEN :p_con_desc = 1 THEN :p_desc ELSE descripcion END
+    WHERE id_registro = :p_id
+"""
+
+_SQL_DELETE = "DELETE FROM registros_tiempo WHERE id_registro = :id"
+
+# Inserta o actualiza en una sola sentencia: si :p_id es NULL o no existe, inserta.
+# Igual que en _SQL_UPDATE, con :p_con_desc = 0 no se toca la descripción guardada.
+_SQL_MERGE = """
+    MERGE INTO registros_tiempo t
+    USING (SELECT :p_id AS id_registro, :p_rut AS empleado_rut, :p_fecha AS fecha_registro,
+                  :p_horas AS horas, :p_proyecto AS proyecto, :p_desc AS descripcion,
+                  :p_con_desc AS con_desc
+           FROM dual) s
+    ON (t.id_registro = s.id_registro)
+    WHEN MATCHED THEN UPDATE SET
+        t.fecha_registro = s.fecha_registro,
+        t.horas = s.horas,
+        t.proyecto = s.proyecto,
+        t.descripcion = CASE WHEN s.con_desc = 1 THEN s.descripcion ELSE t.descripcion END
+    WHEN NOT MATCHED THEN INSERT
+        (empleado_rut, fecha_registro, horas, proyecto, descripcion)
+        VALUES (s.empleado_rut, s.fecha_registro, s.horas, s.proyecto, s.descripcion)
+"""
+
+# Se completa con los placeholders (:1, :2, ...) de cada lote
+_SQL_RUTS_EXISTENTES = "SELECT rut FROM empleados WHERE rut IN ({placeholders})"
+
+_SQL_RUTS_TODOS = "SELECT rut FROM empleados"
+
+
 class RegistroTiempo:
     """
     Clase que representa un registro de horas trabajadas por un empleado en un proyecto.
     Gestiona la creación, lectura, actualización y eliminación de registros de tiempo.
     """
     
+    # Uso __slots__ porque listar_todos() puede crear decenas de miles de objetos;
+    # sin __dict__ cada instancia ocupa bastante menos memoria.
+    __slots__ = ('_id_registro', '_empleado_rut', '_fecha_registro', '_horas',
+                 '_proyecto', '_descripcion', '_fecha_creacion')
+    
     def __init__(self, empleado_rut, fecha_registro, horas, proyecto, descripcion=None, id_registro=None):
         """
         Inicializa un objeto RegistroTiempo.
@@ -30,7 +170,9 @@ class RegistroTiempo:
         self._horas = horas
         self._proyecto = proyecto
         self._descripcion = descripcion or ""
-        self._fecha_creacion = datetime.now()
+        # Solo se fija en crear(); los registros leídos de la BD no la necesitan
+        # y así me ahorro un datetime.now() por cada fila hidratada
+        self._fecha_creacion = None
     
     @property
     def id_registro(self):
@@ -45,8 +187,8 @@ class RegistroTiempo:
     @empleado_rut.setter
     def empleado_rut(self, valor):
         """Establece el RUT del empleado"""
-        if not valor or not isinstance(valor, str) or len(valor) < 8:
-            raise ValueError("El RUT del empleado debe ser válido")
+        if not isinstance(valor, str) or not _RUT_RE.fullmatch(valor):
+            raise ValueError("El RUT del empleado debe ser válido (formato 12.345.678-9 o 12345678-9)")
         self._empleado_rut = valor
     
     @property
@@ -99,8 +241,11 @@ class RegistroTiempo:
     
     @property
     def descripcion(self):
-        """Retorna la descripción del trabajo realizado"""
-        return self._descripcion
+        """
+        Retorna la descripción del trabajo realizado.
+        Si el registro se leyó con incluir_descripcion=False retorna "".
+        """
+        return self._descripcion or ""
     
     @descripcion.setter
     def descripcion(self, valor):
@@ -111,43 +256,221 @@ class RegistroTiempo:
         """
         Inserta el registro de tiempo en la base de datos.
         
-        Aquí ocurre algo importante: primero valido que el empleado exista en la BD
-        antes de crear el registro. Esto evita registros huérfanos (registros sin empleado).
+        Aquí ocurre algo importante: el registro debe pertenecer a un empleado existente.
+        No lo consulto antes con un SELECT (sería un viaje extra a la BD por cada registro);
+        la FK fk_empleado_tiempo ya evita registros huérfanos y, si el RUT no existe,
+        Oracle responde ORA-02291, que capturo para informar el error.
         Usos parámetros nombrados único (:p_rut, :p_fecha, etc) porque tuve un error
         ORA-01745 cuando usaba nombres iguales en múltiples queries en el mismo cursor.
+        Si todo sale bien, el objeto queda con el id_registro que generó Oracle.
         
         Returns:
             bool: True si se creó exitosamente, False en caso contrario
         """
+        self._fecha_creacion = datetime.now()
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    # Validar que el empleado existe
-                    cur.execute("SELECT rut FROM empleados WHERE rut = :rut", 
-                               {"rut": self._empleado_rut})
-                    if not cur.fetchone():
-                        print(f"[ERROR] El empleado con RUT {self._empleado_rut} no existe")
-                        return False
-                    
-                    # Insertar el registro
-                    cur.execute("""
-                        INSERT INTO registros_tiempo 
-                        (empleado_rut, fecha_registro, horas, proyecto, descripcion)
-                        VALUES (:p_rut, :p_fecha, :p_horas, :p_proyecto, :p_desc)
-                    """, {
+                    # Insertar el registro (la FK valida que el empleado exista).
+                    # RETURNING me entrega el ID generado por la columna IDENTITY en
+                    # el mismo viaje, así el objeto queda listo para actualizar().
+                    id_generado = cur.var(int)
+                    cur.execute(_SQL_INSERT, {
                         "p_rut": self._empleado_rut,
                         "p_fecha": self._fecha_registro,
                         "p_horas": self._horas,
                         "p_proyecto": self._proyecto,
-                        "p_desc": self._descripcion
+                        "p_desc": self._descripcion,
+                        "p_id": id_generado
                     })
-                    conn.commit()
+                    commit_outside_transaction(conn)
+                    self._id_registro = id_generado.getvalue()[0]
                     print(f"[OK] Registro de tiempo creado exitosamente")
                     return True
+        except oracledb.IntegrityError as e:
+            error, = e.args
+            if error.code == ORA_FK_PADRE:
+                print(f"[ERROR] El empleado con RUT {self._empleado_rut} no existe")
+            else:
+                print(f"[ERROR] Error al crear registro de tiempo: {e}")
+            return False
         except oracledb.DatabaseError as e:
             print(f"[ERROR] Error al crear registro de tiempo: {e}")
             return False
     
+    @staticmethod
+    def crear_muchos(registros):
+        """
+        Inserta muchos registros de tiempo de una vez (carga masiva).
+        
+        En vez de llamar crear() por cada registro (un SELECT, un INSERT y un commit
+        por fila) envío las filas en lotes con executemany() y hago un solo commit.
+        No verifico antes que cada empleado exista: la FK fk_empleado_tiempo ya lo
+        impide, y con batcherrors=True las filas rechazadas se informan una a una
+        sin detener el resto del lote.
+        
+        Args:
+            registros (list): Lista de objetos RegistroTiempo a insertar
+            
+        Returns:
+            int: Cantidad de registros insertados
+        """
+        filas = [(r._empleado_rut, r._fecha_registro, r._horas, r._proyecto, r._descripcion)
+                 for r in registros]
+        if not filas:
+            return 0
+        
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    insertados = RegistroTiempo._insertar_filas(cur, filas)
+                    commit_outside_transaction(conn)
+                    print(f"[OK] {insertados} de {len(filas)} registros de tiempo creados")
+                    return insertados
+        except oracledb.DatabaseError as e:
+            print(f"[ERROR] Error al crear registros de tiempo: {e}")
+            return 0
+    
+    @staticmethod
+    def importar_lote(filas):
+        """
+        Importa registros de tiempo desde filas crudas (por ejemplo, una planilla CSV).
+        
+        Cada fila pasa por las mismas validaciones del modelo (los setters): formato
+        del RUT, horas entre 0 y 24, proyecto no vacío y fecha como datetime o texto
+        YYYY-MM-DD, que se convierte aquí. Las filas inválidas se informan y se omiten.
+        
+        Antes de insertar traigo todos los RUTs de empleados con una sola consulta y
+        los guardo en un set; así separo las filas válidas de las inválidas en Python
+        en vez de hacer un SELECT por fila. El set solo vive durante esta llamada,
+        por lo que no hay que preocuparse de invalidarlo.
+        
+        Args:
+            filas (iterable): Tuplas (empleado_rut, fecha_registro, horas, proyecto, descripcion)
+            
+        Returns:
+            int: Cantidad de registros insertados
+        """
+        filas = list(filas)
+        if not filas:
+            return 0
+        
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.arraysize = _FILAS_POR_VIAJE
+                    cur.prefetchrows = _FILAS_POR_VIAJE + 1
+                    cur.execute(_SQL_RUTS_TODOS)
+                    existentes = {row[0] for row in cur}
+                    
+                    validas = []
+                    numeros = []
+                    for numero, fila in enumerate(filas, start=1):
+                        try:
+                            fila = RegistroTiempo._validar_fila(fila)
+                        except (TypeError, ValueError) as e:
+                            print(f"[ERROR] Fila {numero}: {e}")
+                            continue
+                        if fila[0] in existentes:
+                            validas.append(fila)
+                            numeros.append(numero)
+                        else:
+                            print(f"[ERROR] Fila {numero}: el empleado con RUT {fila[0]} no existe")
+                    
+                    insertados = RegistroTiempo._insertar_filas(cur, validas, numeros)
+                    commit_outside_transaction(conn)
+                    print(f"[OK] {insertados} de {len(filas)} registros de tiempo importados")
+                    return insertados
+        except oracledb.DatabaseError as e:
+            print(f"[ERROR] Error al importar registros de tiempo: {e}")
+            return 0
+    
+    @staticmethod
+    def _validar_fila(fila):
+        """
+        Valida una fila cruda de importar_lote() con los setters del modelo y la
+        retorna normalizada (fecha como datetime, horas como float, textos sin espacios).
+        
+        Raises:
+            ValueError: Si algún campo no es válido
+        """
+        empleado_rut, fecha_registro, horas, proyecto, descripcion = fila
+        registro = RegistroTiempo.__new__(RegistroTiempo)
+        registro.empleado_rut = empleado_rut
+        registro.fecha_registro = fecha_registro
+        registro.horas = horas
+        registro.proyecto = proyecto
+        registro.descripcion = descripcion
+        return (registro._empleado_rut, registro._fecha_registro, registro._horas,
+                registro._proyecto, registro._descripcion)
+    
+    @staticmethod
+    def _insertar_filas(cur, filas, numeros=None):
+        """
+        Inserta las filas con executemany() en lotes de _TAMANO_LOTE (sin hacer commit).
+        Con batcherrors=True las filas rechazadas se informan una a una sin detener
+        el resto del lote.
+        
+        Args:
+            cur (Cursor): Cursor de la conexión en uso
+            filas (list): Tuplas ya validadas, con la fecha como datetime
+            numeros (list, optional): Número de cada fila en la entrada original,
+                para los mensajes de error; por defecto su posición en filas
+        
+        Returns:
+            int: Cantidad de filas insertadas
+        """
+        insertados = 0
+        if not filas:
+            return insertados
+        # Defino los tipos una sola vez para que oracledb no tenga que
+        # redimensionar los buffers entre lotes
+        cur.setinputsizes(12, oracledb.DB_TYPE_DATE, None, 100, 500)
+        for inicio in range(0, len(filas), _TAMANO_LOTE):
+            lote = filas[inicio:inicio + _TAMANO_LOTE]
+            cur.executemany(_SQL_INSERT_LOTE, lote, batcherrors=True)
+            errores = cur.getbatcherrors()
+            for error in errores:
+                fila = inicio + error.offset
+                numero = numeros[fila] if numeros else fila + 1
+                print(f"[ERROR] Registro {numero} (RUT {filas[fila][0]}) "
+                      f"no se pudo crear: {error.message}")
+            insertados += len(lote) - len(errores)
+        return insertados
+    
+    @staticmethod
+    def _filter_existing_ruts(ruts):
+        """
+        Retorna cuáles de los RUTs indicados existen en la tabla empleados.
+        Sirve para validar de antemano un lote de registros con una sola consulta
+        (WHERE rut IN (...)) en vez de un SELECT por cada RUT.
+        
+        Args:
+            ruts (iterable): RUTs a verificar
+            
+        Returns:
+            set: RUTs que existen en la BD
+        """
+        ruts_unicos = list(dict.fromkeys(ruts))
+        existentes = set()
+        if not ruts_unicos:
+            return existentes
+        
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    # Cada lote puede devolver hasta MAX_BINDS_IN filas
+                    cur.arraysize = MAX_BINDS_IN
+                    cur.prefetchrows = MAX_BINDS_IN + 1
+                    for inicio in range(0, len(ruts_unicos), MAX_BINDS_IN):
+                        lote = ruts_unicos[inicio:inicio + MAX_BINDS_IN]
+                        placeholders = ", ".join(f":{i + 1}" for i in range(len(lote)))
+                        cur.execute(_SQL_RUTS_EXISTENTES.format(placeholders=placeholders), lote)
+                        existentes.update(row[0] for row in cur)
+        except oracledb.DatabaseError as e:
+            print(f"[ERROR] Error al verificar empleados: {e}")
+        return existentes
+    
     @staticmethod
     def leer_por_id(id_registro):
         """
@@ -160,135 +483,241 @@ class RegistroTiempo:
             RegistroTiempo: Objeto con los datos del registro, None si no existe
         """
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id_registro, empleado_rut, fecha_registro, horas, 
-                               proyecto, descripcion
-                        FROM registros_tiempo
-                        WHERE id_registro = :id
-                    """, {"id": id_registro})
+                    # Consulta de una sola fila: no hace falta reservar un arreglo de 100
+                    cur.arraysize = 1
+                    cur.prefetchrows = 2
+                    cur.execute(_SQL_SELECT_POR_ID, {"id": id_registro})
                     row = cur.fetchone()
                     if row:
-                        return RegistroTiempo.crear_desde_dict({
-                            'id_registro': row[0],
-                            'empleado_rut': row[1],
-                            'fecha_registro': row[2],
-                            'horas': row[3],
-                            'proyecto': row[4],
-                            'descripcion': row[5]
-                        })
+                        return RegistroTiempo._from_row(row)
                     return None
         except oracledb.DatabaseError as e:
             print(f"[ERROR] Error al buscar registro: {e}")
             return None
     
     @staticmethod
-    def leer_por_empleado(empleado_rut):
+    def leer_por_empleado(empleado_rut, incluir_descripcion=True):
         """
         Obtiene todos los registros de tiempo de un empleado.
         Lo uso para ver el historial de horas trabajadas por un empleado específico.
         Ordenados por fecha descendente para ver los más recientes primero.
         
+        Es un generador: los registros se leen de Oracle de a lotes mientras se
+        recorren, así no cargo en memoria miles de objetos de una vez. Si necesitas
+        una lista (por ejemplo para usar len()), usa list(...).
+        
+        Args:
+            empleado_rut (str): RUT del empleado
+            incluir_descripcion (bool): Si es False no se trae la descripción
+                (queda vacía), para listados que no la muestran
+            
+        Yields:
+            RegistroTiempo: Registros del empleado
+        """
+        yield from RegistroTiempo._iterar_consulta(
+            _SQL_SELECT_POR_EMPLEADO[incluir_descripcion], {"rut": empleado_rut},
+            "Error al buscar registros del empleado", incluir_descripcion)
+    
+    @staticmethod
+    def leer_por_proyecto(proyecto, incluir_descripcion=True):
+        """
+        Obtiene todos los registros de tiempo asociados a un proyecto.
+        Es un generador, igual que leer_por_empleado().
+        
+        Args:
+            proyecto (str): Nombre del proyecto
+            incluir_descripcion (bool): Si es False no se trae la descripción
+            
+        Yields:
+            RegistroTiempo: Registros del proyecto
+        """
+        yield from RegistroTiempo._iterar_consulta(
+            _SQL_SELECT_POR_PROYECTO[incluir_descripcion], {"proyecto": proyecto},
+            "Error al buscar registros por proyecto", incluir_descripcion)
+    
+    @staticmethod
+    def listar_todos(incluir_descripcion=True):
+        """
+        Obtiene todos los registros de tiempo.
+        Es un generador, igual que leer_por_empleado(). Para mostrar una página
+        en pantalla conviene listar_paginado().
+        
+        Args:
+            incluir_descripcion (bool): Si es False no se trae la descripción
+        
+        Yields:
+            RegistroTiempo: Todos los registros, del más reciente al más antiguo
+        """
+        yield from RegistroTiempo._iterar_consulta(
+            _SQL_SELECT_TODOS[incluir_descripcion], {}, "Error al listar registros", incluir_descripcion)
+    
+    @staticmethod
+    def total_horas_por_empleado(empleado_rut):
+        """
+        Suma las horas registradas por un empleado directamente en Oracle.
+        Es mucho más barato que recorrer leer_por_empleado() y sumar en Python:
+        solo viaja un número por la red en vez de todas las filas.
+        
         Args:
             empleado_rut (str): RUT del empleado
             
         Returns:
-            list: Lista de objetos RegistroTiempo
+            float: Total de horas (0 si no tiene registros o hubo un error)
         """
-        registros = []
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id_registro, empleado_rut, fecha_registro, horas, 
-                               proyecto, descripcion
-                        FROM registros_tiempo
-                        WHERE empleado_rut = :rut
-                        ORDER BY fecha_registro DESC
-                    """, {"rut": empleado_rut})
-                    for row in cur.fetchall():
-                        registros.append(RegistroTiempo.crear_desde_dict({
-                            'id_registro': row[0],
-                            'empleado_rut': row[1],
-                            'fecha_registro': row[2],
-                            'horas': row[3],
-                            'proyecto': row[4],
-                            'descripcion': row[5]
-                        }))
+                    cur.execute(_SQL_TOTAL_HORAS_EMPLEADO, {"rut": empleado_rut})
+                    return cur.fetchone()[0]
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al buscar registros del empleado: {e}")
-        return registros
+            print(f"[ERROR] Error al sumar horas del empleado: {e}")
+            return 0
     
     @staticmethod
-    def leer_por_proyecto(proyecto):
+    def total_horas_por_proyecto(proyecto):
         """
-        Obtiene todos los registros de tiempo asociados a un proyecto.
+        Suma en Oracle las horas registradas en un proyecto.
+        
+        Args:
+            proyecto (str): Nombre del proyecto (sin distinguir mayúsculas)
+            
+        Returns:
+            float: Total de horas (0 si no tiene registros o hubo un error)
+        """
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(_SQL_TOTAL_HORAS_PROYECTO, {"proyecto": proyecto})
+                    return cur.fetchone()[0]
+        except oracledb.DatabaseError as e:
+            print(f"[ERROR] Error al sumar horas del proyecto: {e}")
+            return 0
+    
+    @staticmethod
+    def horas_por_empleado_mes(anio, mes):
+        """
+        Total de horas de cada empleado en un mes, agrupado en Oracle (GROUP BY).
+        Solo viaja una fila por empleado en vez de todos sus registros del mes.
+        
+        Args:
+            anio (int): Año, por ejemplo 2024
+            mes (int): Mes, de 1 a 12
+            
+        Returns:
+            dict: RUT del empleado -> total de horas del mes (vacío si hubo un error)
+        """
+        inicio = datetime(anio, mes, 1)
+        fin = datetime(anio + 1, 1, 1) if mes == 12 else datetime(anio, mes + 1, 1)
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.arraysize = _FILAS_POR_VIAJE
+                    cur.prefetchrows = _FILAS_POR_VIAJE + 1
+                    cur.execute(_SQL_HORAS_POR_EMPLEADO_MES, {"p_inicio": inicio, "p_fin": fin})
+                    return dict(cur)
+        except oracledb.DatabaseError as e:
+            print(f"[ERROR] Error al agrupar horas por empleado: {e}")
+            return {}
+    
+    @staticmethod
+    def ids_por_proyecto(proyecto):
+        """
+        Obtiene solo los IDs de los registros de un proyecto, sin construir objetos.
         
         Args:
             proyecto (str): Nombre del proyecto
             
         Returns:
-            list: Lista de objetos RegistroTiempo
+            list: IDs de los registros, del más reciente al más antiguo
         """
-        registros = []
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id_registro, empleado_rut, fecha_registro, horas, 
-                               proyecto, descripcion
-                        FROM registros_tiempo
-                        WHERE UPPER(proyecto) = UPPER(:proyecto)
-                        ORDER BY fecha_registro DESC
-                    """, {"proyecto": proyecto})
-                    for row in cur.fetchall():
-                        registros.append(RegistroTiempo.crear_desde_dict({
-                            'id_registro': row[0],
-                            'empleado_rut': row[1],
-                            'fecha_registro': row[2],
-                            'horas': row[3],
-                            'proyecto': row[4],
-                            'descripcion': row[5]
-                        }))
+                    cur.arraysize = _FILAS_POR_VIAJE
+                    cur.prefetchrows = _FILAS_POR_VIAJE + 1
+                    cur.execute(_SQL_IDS_POR_PROYECTO, {"proyecto": proyecto})
+                    return [row[0] for row in cur]
         except oracledb.DatabaseError as e:
             print(f"[ERROR] Error al buscar registros por proyecto: {e}")
-        return registros
+            return []
     
     @staticmethod
-    def listar_todos():
+    def listar_paginado(offset, limit):
         """
-        Obtiene todos los registros de tiempo.
+        Obtiene una página de registros de tiempo (Oracle 12c+ OFFSET/FETCH NEXT).
+        Pensado para la UI: solo viajan por la red las filas que se van a mostrar.
         
+        Args:
+            offset (int): Cantidad de registros a saltar
+            limit (int): Máximo de registros a retornar
+            
         Returns:
             list: Lista de objetos RegistroTiempo
         """
         registros = []
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id_registro, empleado_rut, fecha_registro, horas, 
-                               proyecto, descripcion
-                        FROM registros_tiempo
-                        ORDER BY fecha_registro DESC
-                    """)
-                    for row in cur.fetchall():
-                        registros.append(RegistroTiempo.crear_desde_dict({
-                            'id_registro': row[0],
-                            'empleado_rut': row[1],
-                            'fecha_registro': row[2],
-                            'horas': row[3],
-                            'proyecto': row[4],
-                            'descripcion': row[5]
-                        }))
+                    cur.arraysize = limit
+                    cur.prefetchrows = limit + 1
+                    cur.execute(_SQL_SELECT_PAGINA, {"p_offset": offset, "p_limit": limit})
+                    for row in cur.fetchmany(limit):
+                        registros.append(RegistroTiempo._from_row(row))
         except oracledb.DatabaseError as e:
             print(f"[ERROR] Error al listar registros: {e}")
         return registros
     
+    @staticmethod
+    def _iterar_consulta(sql, binds, mensaje_error, incluir_descripcion=True):
+        """
+        Ejecuta una consulta de registros y los entrega uno a uno.
+        Configuro arraysize/prefetchrows para traer 1000 filas por viaje de red
+        (el valor por defecto es 100) y uso fetchmany() para no materializar todo
+        el resultado. La conexión queda abierta mientras se recorre el generador.
+        """
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.arraysize = _FILAS_POR_VIAJE
+                    cur.prefetchrows = _FILAS_POR_VIAJE + 1
+                    cur.execute(sql, binds)
+                    while True:
+                        rows = cur.fetchmany(_FILAS_POR_VIAJE)
+                        if not rows:
+                            break
+                        for row in rows:
+                            yield RegistroTiempo._from_row(row, incluir_descripcion)
+        except oracledb.DatabaseError as e:
+            print(f"[ERROR] {mensaje_error}: {e}")
+    
+    @staticmethod
+    def _from_row(row, incluir_descripcion=True):
+        """
+        Crea un RegistroTiempo desde una fila de las consultas de este módulo.
+        
+        Es el camino caliente de los listados, así que no paso por __init__ ni por
+        crear_desde_dict(): los datos vienen de Oracle y las restricciones de la tabla
+        ya los validaron, por lo que asigno los slots directamente. Para datos que
+        ingresa el usuario se sigue usando el constructor.
+        Si la consulta no trajo la descripción, _descripcion queda en None (no cargada).
+        """
+        registro = RegistroTiempo.__new__(RegistroTiempo)
+        registro._id_registro = row[0]
+        registro._empleado_rut = row[1]
+        registro._fecha_registro = row[2]
+        registro._horas = row[3]
+        registro._proyecto = row[4]
+        registro._descripcion = (row[5] or "") if incluir_descripcion else None
+        registro._fecha_creacion = None
+        return registro
+    
     def actualizar(self):
         """
         Actualiza el registro de tiempo en la base de datos.
+        Si el objeto se leyó sin descripción (incluir_descripcion=False) y no se le
+        asignó una nueva, la descripción guardada en la BD no se modifica.
         
         Returns:
             bool: True si se actualizó exitosamente, False en caso contrario
@@ -298,20 +727,14 @@ class RegistroTiempo:
             return False
         
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        UPDATE registros_tiempo
-                        SET fecha_registro = :p_fecha,
-                            horas = :p_horas,
-                            proyecto = :p_proyecto,
-                            descripcion = :p_desc
-                        WHERE id_registro = :p_id
-                    """, {
+                    cur.execute(_SQL_UPDATE, {
                         "p_fecha": self._fecha_registro,
                         "p_horas": self._horas,
                         "p_proyecto": self._proyecto,
                         "p_desc": self._descripcion,
+                        "p_con_desc": 0 if self._descripcion is None else 1,
                         "p_id": self._id_registro
                     })
                     
@@ -319,7 +742,7 @@ class RegistroTiempo:
                         print(f"[ERROR] No se encontró registro con ID {self._id_registro}")
                         return False
                     
-                    conn.commit()
+                    commit_outside_transaction(conn)
                     print(f"[OK] Registro de tiempo actualizado exitosamente")
                     return True
         except oracledb.DatabaseError as e:
@@ -338,28 +761,131 @@ class RegistroTiempo:
             bool: True si se eliminó exitosamente, False en caso contrario
         """
         try:
-            with get_connection() as conn:
+            with current_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("DELETE FROM registros_tiempo WHERE id_registro = :id", 
-                               {"id": id_registro})
+                    cur.execute(_SQL_DELETE, {"id": id_registro})
                     
                     if cur.rowcount == 0:
                         print(f"[ERROR] No se encontró registro con ID {id_registro}")
                         return False
                     
-                    conn.commit()
+                    commit_outside_transaction(conn)
                     print(f"[OK] Registro de tiempo eliminado exitosamente")
                     return True
         except oracledb.DatabaseError as e:
             print(f"[ERROR] Error al eliminar registro: {e}")
             return False
     
+    def _binds_merge(self):
+        """Parámetros de _SQL_MERGE para este registro."""
+        return {
+            "p_id": self._id_registro,
+            "p_rut": self._empleado_rut,
+            "p_fecha": self._fecha_registro,
+            "p_horas": self._horas,
+            "p_proyecto": self._proyecto,
+            "p_desc": self._descripcion,
+            "p_con_desc": 0 if self._descripcion is None else 1
+        }
+    
+    def upsert(self):
+        """
+        Crea el registro si no existe o lo actualiza si ya existe, con un solo MERGE.
+        Útil al importar planillas donde no sé si cada fila ya está en la BD: me
+        ahorro el SELECT previo y la decisión entre crear() y actualizar().
+        
+        MERGE no admite RETURNING, así que si el registro se inserta el objeto
+        sigue sin id_registro; si lo necesitas, usa crear(). Igual que actualizar(),
+        no sobrescribe la descripción de un registro leído sin ella.
+        
+        Args:
+            
+        Returns:
+            bool: True si se guardó exitosamente, False en caso contrario
+        """
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(_SQL_MERGE, self._binds_merge())
+                    commit_outside_transaction(conn)
+                    print(f"[OK] Registro de tiempo guardado exitosamente")
+                    return True
+        except oracledb.IntegrityError as e:
+            error, = e.args
+            if error.code == ORA_FK_PADRE:
+                print(f"[ERROR] El empleado con RUT {self._empleado_rut} no existe")
+            else:
+                print(f"[ERROR] Error al guardar registro de tiempo: {e}")
+            return False
+        except oracledb.DatabaseError as e:
+            print(f"[ERROR] Error al guardar registro de tiempo: {e}")
+            return False
+    
+    @staticmethod
+    def upsert_muchos(registros):
+        """
+        Versión masiva de upsert(): envía los MERGE en lotes con executemany()
+        y hace un solo commit. Las filas rechazadas se informan una a una.
+        
+        Args:
+            registros (list): Lista de objetos RegistroTiempo (con o sin id_registro)
+            
+        Returns:
+            int: Cantidad de registros insertados o actualizados
+        """
+        filas = [r._binds_merge() for r in registros]
+        if not filas:
+            return 0
+        
+        guardados = 0
+        try:
+            with current_connection() as conn:
+                with conn.cursor() as cur:
+                    # p_id puede venir en None en las primeras filas, así que fijo los tipos
+                    cur.setinputsizes(p_id=oracledb.DB_TYPE_NUMBER, p_rut=12,
+                                      p_fecha=oracledb.DB_TYPE_DATE, p_proyecto=100, p_desc=500)
+                    for inicio in range(0, len(filas), _TAMANO_LOTE):
+                        lote = filas[inicio:inicio + _TAMANO_LOTE]
+                        cur.executemany(_SQL_MERGE, lote, batcherrors=True)
+                        errores = cur.getbatcherrors()
+                        for error in errores:
+                            fila = inicio + error.offset
+                            print(f"[ERROR] Registro {fila + 1} (RUT {filas[fila]['p_rut']}) "
+                                  f"no se pudo guardar: {error.message}")
+                        guardados += len(lote) - len(errores)
+                    commit_outside_transaction(conn)
+                    print(f"[OK] {guardados} de {len(filas)} registros de tiempo guardados")
+                    return guardados
+        except oracledb.DatabaseError as e:
+            print(f"[ERROR] Error al guardar registros de tiempo: {e}")
+            return 0
+    
+    @staticmethod
+    def transaction():
+        """
+        Agrupa varias escrituras en una sola transacción (database.conexion.transaction()).
+        
+        Hacer commit en cada crear()/actualizar()/eliminar() obliga a Oracle a escribir
+        el redo log a disco una vez por fila. Dentro de este bloque esos métodos (y los
+        de Proyecto) comparten la conexión y no hacen commit; al salir se hace un único
+        commit, o rollback si ocurre una excepción.
+        
+        Uso:
+            with RegistroTiempo.transaction():
+                for registro in registros:
+                    registro.crear()
+        
+        Returns:
+            Context manager que entrega la conexión usada por la transacción
+        """
+        return transaction()
+    
     @staticmethod
     def crear_desde_dict(data):
         """
         Factory method para crear un objeto RegistroTiempo desde un diccionario.
-        Lo uso cuando leo datos de la BD. Es más flexible que usar el constructor
-        directamente porque puedo manejar diferentes formatos de fecha que vienen de Oracle.
+        Acepta fechas como datetime o como texto YYYY-MM-DD y horas numéricas o en texto.
+        Las lecturas de la BD no pasan por aquí sino por _from_row().
         
         Args:
             data (dict): Diccionario con los datos del registro
@@ -368,19 +894,20 @@ class RegistroTiempo:
             RegistroTiempo: Objeto con los datos del diccionario
         """
         try:
-            # Convertir fecha si viene de la BD como objeto datetime
-            fecha_registro = data.get('fecha_registro')
-            if isinstance(fecha_registro, str):
-                fecha_registro = datetime.strptime(fecha_registro, "%Y-%m-%d")
-            
-            return RegistroTiempo(
+            horas = data.get('horas', 0)
+            registro = RegistroTiempo(
                 empleado_rut=data.get('empleado_rut'),
-                fecha_registro=fecha_registro,
-                horas=float(data.get('horas', 0)),
+                fecha_registro=data.get('fecha_registro'),
+                horas=horas if isinstance(horas, float) else float(horas),
                 proyecto=data.get('proyecto'),
                 descripcion=data.get('descripcion', ''),
                 id_registro=data.get('id_registro')
             )
+            # Las fechas en texto (YYYY-MM-DD) las convierte el setter; las que
+            # vienen de Oracle ya son datetime y no pasan por strptime()
+            if isinstance(registro._fecha_registro, str):
+                registro.fecha_registro = registro._fecha_registro
+            return registro
         except (KeyError, ValueError) as e:
             print(f"[ERROR] Error al crear RegistroTiempo desde diccionario: {e}")
             return None
@@ -11,142 +11,144 @@ username = os.getenv("ORACLE_USER")
 dsn = os.getenv("ORACLE_DSN")
 password = os.getenv("ORACLE_PASSWORD")
 
+# Tablas de la aplicación. DROP ... CASCADE CONSTRAINTS elimina también las FKs
+# que las referencian, así que el orden de eliminación no importa.
+TABLES = ["registros_tiempo", "empleado_proyecto", "empleados", "proyectos",
+          "departamentos", "usuarios"]
+
+DDL_DEPARTAMENTOS = """
+    CREATE TABLE departamentos (
+        id_depto NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+        nombre VARCHAR2(100) NOT NULL UNIQUE,
+        gerente VARCHAR2(100),
+        descripcion VARCHAR2(500),
+        fecha_creacion DATE DEFAULT SYSDATE
+    )
+"""
+
+# empleados tiene FK a departamentos
+DDL_EMPLEADOS = """
+    CREATE TABLE empleados (
+        rut VARCHAR2(12) PRIMARY KEY,
+        nombre VARCHAR2(100) NOT NULL,
+        apellido VARCHAR2(100) NOT NULL,
+        cargo VARCHAR2(100) NOT NULL,
+        salario NUMBER(10, 2) NOT NULL,
+        id_departamento NUMBER,
+        CONSTRAINT fk_depto FOREIGN KEY (id_departamento) 
+            REFERENCES departamentos(id_depto)
+    )
+"""
+
+DDL_PROYECTOS = """
+    CREATE TABLE proyectos (
+        id_proyecto NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+        nombre VARCHAR2(100) NOT NULL UNIQUE,
+        descripcion VARCHAR2(500),
+        fecha_inicio DATE NOT NULL,
+        estado VARCHAR2(50) DEFAULT 'Activo',
+        fecha_creacion DATE DEFAULT SYSDATE
+    )
+"""
+
+# Tabla intermedia empleado_proyecto (relación N:N)
+DDL_EMPLEADO_PROYECTO = """
+    CREATE TABLE empleado_proyecto (
+        id_asignacion NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+        empleado_rut VARCHAR2(12) NOT NULL,
+        id_proyecto NUMBER NOT NULL,
+        fecha_asignacion DATE DEFAULT SYSDATE,
+        CONSTRAINT fk_emp_proy FOREIGN KEY (empleado_rut) 
+            REFERENCES empleados(rut),
+        CONSTRAINT fk_proy_emp FOREIGN KEY (id_proyecto) 
+            REFERENCES proyectos(id_proyecto),
+        CONSTRAINT uk_emp_proy UNIQUE (empleado_rut, id_proyecto)
+    )
+"""
+
+# registros_tiempo tiene FK a empleados
+DDL_REGISTROS_TIEMPO = """
+    CREATE TABLE registros_tiempo (
+        id_registro NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+        empleado_rut VARCHAR2(12) NOT NULL,
+        fecha_registro DATE NOT NULL,
+        horas NUMBER(5, 2) NOT NULL,
+        proyecto VARCHAR2(100) NOT NULL,
+        descripcion VARCHAR2(500),
+        fecha_creacion DATE DEFAULT SYSDATE,
+        CONSTRAINT fk_empleado_tiempo FOREIGN KEY (empleado_rut) 
+            REFERENCES empleados(rut)
+    )
+"""
+
+DDL_USUARIOS = """
+    CREATE TABLE usuarios (
+        id_usuario NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+        nombre_usuario VARCHAR2(50) NOT NULL UNIQUE,
+        contraseña_hash VARCHAR2(128) NOT NULL,
+        rol VARCHAR2(20) NOT NULL,
+        email VARCHAR2(100),
+        activo NUMBER DEFAULT 1,
+        fecha_creacion DATE DEFAULT SYSDATE,
+        ultimo_login DATE,
+        intentos_fallidos NUMBER DEFAULT 0
+    )
+"""
+
+# Sentencias CREATE en orden de dependencias (las tablas referenciadas primero),
+# incluidos los índices que usan las consultas de Proyecto y RegistroTiempo.
+DDLS = (
+    DDL_DEPARTAMENTOS,
+    DDL_EMPLEADOS,
+    DDL_PROYECTOS,
+    "CREATE INDEX ix_proyectos_nombre_upper ON proyectos (UPPER(nombre))",
+    DDL_EMPLEADO_PROYECTO,
+    DDL_REGISTROS_TIEMPO,
+    "CREATE INDEX ix_regtime_emp_fecha ON registros_tiempo (empleado_rut, fecha_registro DESC)",
+    "CREATE INDEX ix_regtime_proy_upper ON registros_tiempo (UPPER(proyecto))",
+    "CREATE INDEX ix_regtime_fecha ON registros_tiempo (fecha_registro DESC)",
+    DDL_USUARIOS,
+    "CREATE INDEX ix_usuarios_login ON usuarios (nombre_usuario, activo, contraseña_hash, rol, email, id_usuario)",
+)
+
+
+def _bloque_plsql(sentencias):
+    """Arma un bloque anónimo que ejecuta cada sentencia con EXECUTE IMMEDIATE."""
+    # Dentro de EXECUTE IMMEDIATE las comillas simples van duplicadas
+    return "BEGIN\n" + "".join(
+        "EXECUTE IMMEDIATE '{}';\n".format(sql.strip().replace("'", "''")) for sql in sentencias
+    ) + "END;"
+
+
 def reset_tables():
     """Elimina y recrea todas las tablas de la BD: departamentos, empleados, proyectos, empleado_proyecto, registros_tiempo, usuarios"""
     try:
         connection = oracledb.connect(user=username, password=password, dsn=dsn)
         cursor = connection.cursor()
         
-        # Eliminar tablas en orden correcto (FK primero)
-        try:
-            cursor.execute("DROP TABLE registros_tiempo")
-            print("✓ Tabla 'registros_tiempo' eliminada")
-        except Exception as e:
-            print(f"⚠ Tabla 'registros_tiempo' no existía o error: {e}")
-        
-        try:
-            cursor.execute("DROP TABLE empleado_proyecto")
-            print("✓ Tabla 'empleado_proyecto' eliminada")
-        except Exception as e:
-            print(f"⚠ Tabla 'empleado_proyecto' no existía o error: {e}")
-        
-        try:
-            cursor.execute("DROP TABLE empleados")
-            print("✓ Tabla 'empleados' eliminada")
-        except Exception as e:
-            print(f"⚠ Tabla 'empleados' no existía o error: {e}")
-        
-        try:
-            cursor.execute("DROP TABLE proyectos")
-            print("✓ Tabla 'proyectos' eliminada")
-        except Exception as e:
-            print(f"⚠ Tabla 'proyectos' no existía o error: {e}")
-        
-        try:
-            cursor.execute("DROP TABLE departamentos")
-            print("✓ Tabla 'departamentos' eliminada")
-        except Exception as e:
-            print(f"⚠ Tabla 'departamentos' no existía o error: {e}")
-        
-        try:
-            cursor.execute("DROP TABLE usuarios")
-            print("✓ Tabla 'usuarios' eliminada")
-        except Exception as e:
-            print(f"⚠ Tabla 'usuarios' no existía o error: {e}")
-        
-        # Crear tabla departamentos
-        ddl_departamentos = """
-        CREATE TABLE departamentos (
-            id_depto NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-            nombre VARCHAR2(100) NOT NULL UNIQUE,
-            gerente VARCHAR2(100),
-            descripcion VARCHAR2(500),
-            fecha_creacion DATE DEFAULT SYSDATE
-        )
-        """
-        cursor.execute(ddl_departamentos)
-        print("✓ Tabla 'departamentos' creada exitosamente")
-        
-        # Crear tabla empleados con FK a departamentos
-        ddl_empleados = """
-        CREATE TABLE empleados (
-            rut VARCHAR2(12) PRIMARY KEY,
-            nombre VARCHAR2(100) NOT NULL,
-            apellido VARCHAR2(100) NOT NULL,
-            cargo VARCHAR2(100) NOT NULL,
-            salario NUMBER(10, 2) NOT NULL,
-            id_departamento NUMBER,
-            CONSTRAINT fk_depto FOREIGN KEY (id_departamento) 
-                REFERENCES departamentos(id_depto)
-        )
-        """
-        cursor.execute(ddl_empleados)
-        print("✓ Tabla 'empleados' creada exitosamente")
-        
-        # Crear tabla proyectos
-        ddl_proyectos = """
-        CREATE TABLE proyectos (
-            id_proyecto NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-            nombre VARCHAR2(100) NOT NULL UNIQUE,
-            descripcion VARCHAR2(500),
-            fecha_inicio DATE NOT NULL,
-            estado VARCHAR2(50) DEFAULT 'Activo',
-            fecha_creacion DATE DEFAULT SYSDATE
-        )
-        """
-        cursor.execute(ddl_proyectos)
-        print("✓ Tabla 'proyectos' creada exitosamente")
-        
-        # Crear tabla intermedia empleado_proyecto
-        ddl_empleado_proyecto = """
-        CREATE TABLE empleado_proyecto (
-            id_asignacion NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-            empleado_rut VARCHAR2(12) NOT NULL,
-            id_proyecto NUMBER NOT NULL,
-            fecha_asignacion DATE DEFAULT SYSDATE,
-            CONSTRAINT fk_emp_proy FOREIGN KEY (empleado_rut) 
-                REFERENCES empleados(rut),
-            CONSTRAINT fk_proy_emp FOREIGN KEY (id_proyecto) 
-                REFERENCES proyectos(id_proyecto),
-            CONSTRAINT uk_emp_proy UNIQUE (empleado_rut, id_proyecto)
-        )
-        """
-        cursor.execute(ddl_empleado_proyecto)
-        print("✓ Tabla 'empleado_proyecto' creada exitosamente")
-        
-        # Crear tabla registros_tiempo con FK a empleados
-        ddl_registros_tiempo = """
-        CREATE TABLE registros_tiempo (
-            id_registro NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-            empleado_rut VARCHAR2(12) NOT NULL,
-            fecha_registro DATE NOT NULL,
-            horas NUMBER(5, 2) NOT NULL,
-            proyecto VARCHAR2(100) NOT NULL,
-            descripcion VARCHAR2(500),
-            fecha_creacion DATE DEFAULT SYSDATE,
-            CONSTRAINT fk_empleado_tiempo FOREIGN KEY (empleado_rut) 
-                REFERENCES empleados(rut)
-        )
-        """
-        cursor.execute(ddl_registros_tiempo)
-        print("✓ Tabla 'registros_tiempo' creada exitosamente")
+        # Eliminar todas las tablas en un solo bloque PL/SQL (un viaje a la BD).
+        # Si una tabla no existía (ORA-00942) la ignoro; cualquier otro error se propaga.
+        cursor.execute("""
+            DECLARE
+                TYPE t_nombres IS TABLE OF VARCHAR2(30);
+                tablas t_nombres := t_nombres({tablas});
+            BEGIN
+                FOR i IN 1 .. tablas.COUNT LOOP
+                    BEGIN
+                        EXECUTE IMMEDIATE 'DROP TABLE ' || tablas(i) || ' CASCADE CONSTRAINTS';
+                    EXCEPTION
+                        WHEN OTHERS THEN
+                            IF SQLCODE != -942 THEN
+                                RAISE;
+                            END IF;
+                    END;
+                END LOOP;
+            END;
+        """.format(tablas=", ".join(f"'{t}'" for t in TABLES)))
         
-        # Crear tabla usuarios
-        ddl_usuarios = """
-        CREATE TABLE usuarios (
-            id_usuario NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-            nombre_usuario VARCHAR2(50) NOT NULL UNIQUE,
-            contraseña_hash VARCHAR2(64) NOT NULL,
-            rol VARCHAR2(20) NOT NULL,
-            email VARCHAR2(100),
-            activo NUMBER DEFAULT 1,
-            fecha_creacion DATE DEFAULT SYSDATE,
-            ultimo_login DATE,
-            intentos_fallidos NUMBER DEFAULT 0
-        )
-        """
-        cursor.execute(ddl_usuarios)
-        print("✓ Tabla 'usuarios' creada exitosamente")
+        # Crear todas las tablas e índices en un segundo bloque PL/SQL
+        cursor.execute(_bloque_plsql(DDLS))
+        print(f"✓ {len(TABLES)} tablas recreadas: {', '.join(TABLES)}")
         
         connection.commit()
         cursor.close()
@@ -160,12 +162,8 @@ if __name__ == "__main__":
     print("⚠ ADVERTENCIA: RESET DE BASE DE DATOS")
     print("="*60)
     print("Esto eliminará TODOS los datos de las tablas:")
-    print("  - registros_tiempo")
-    print("  - empleado_proyecto")
-    print("  - empleados")
-    print("  - proyectos")
-    print("  - departamentos")
-    print("  - usuarios")
+    for tabla in TABLES:
+        print(f"  - {tabla}")
     print("="*60)
     confirmar = input("¿Desea continuar? (s/n): ")
     if confirmar.lower() == 's':
@@ -6,68 +6,202 @@ del sistema porque valida quién puede hacer qué en la aplicación.
 """
 
 import hashlib
-import os
-from datetime import datetime
-from database.conexion import get_connection
+import hmac
+import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from database.conexion import get_connection, create_table_usuarios, ORA_UNIQUE
 import oracledb
 
+# Los errores y advertencias se registran con logging en vez de imprimirse.
+# main.py los muestra por consola con logging.basicConfig(); como librería no emiten nada.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Sentencias SQL definidas una sola vez a nivel de módulo: el texto es siempre el
+# mismo objeto, así Oracle lo encuentra en la caché de sentencias y no lo vuelve a parsear.
+_SQL_CONTAR_USUARIOS = "SELECT COUNT(*) FROM usuarios"
+
+_SQL_INSERT_ADMIN = """
+    INSERT INTO usuarios 
+    (nombre_usuario, contraseña_hash, rol, email, activo)
+    VALUES ('admin', :hash, 'admin', 'admin@empresa.com', 1)
+"""
+
+_SQL_SELECT_LOGIN = """
+    SELECT id_usuario, nombre_usuario, rol, email, contraseña_hash
+    FROM usuarios
+    WHERE nombre_usuario = :usuario AND activo = 1
+"""
+
+_SQL_REGISTRAR_LOGIN = """
+    BEGIN
+        IF :exito = 1 THEN
+            UPDATE usuarios
+            SET ultimo_login = SYSDATE, intentos_fallidos = 0,
+                contraseña_hash = NVL(:hash, contraseña_hash)
+            WHERE id_usuario = :id;
+        ELSE
+            UPDATE usuarios
+            SET intentos_fallidos = intentos_fallidos + 1
+            WHERE nombre_usuario = :usuario;
+        END IF;
+        COMMIT;
+    END;
+"""
+
+_SQL_SELECT_HASH_POR_ID = """
+    SELECT contraseña_hash FROM usuarios
+    WHERE id_usuario = :id
+"""
+
+_SQL_UPDATE_HASH = """
+    UPDATE usuarios
+    SET contraseña_hash = :hash
+    WHERE id_usuario = :id
+"""
+
+_SQL_INSERT_USUARIO = """
+    INSERT INTO usuarios 
+    (nombre_usuario, contraseña_hash, rol, email, activo)
+    VALUES (:usuario, :hash, :rol, :email, 1)
+"""
+
+_SQL_LISTAR_USUARIOS = """
+    SELECT id_usuario, nombre_usuario, rol, email, activo, ultimo_login
+    FROM usuarios
+    ORDER BY nombre_usuario
+"""
+
+_SQL_DESACTIVAR_USUARIO = """
+    UPDATE usuarios
+    SET activo = 0
+    WHERE id_usuario = :id
+"""
+
+# Acciones permitidas por cada rol. Las armo una sola vez al importar el módulo
+# (y no en cada llamada a tiene_permiso) y como frozenset, así la verificación
+# "accion in permisos" es una búsqueda por hash en vez de recorrer una lista.
+_PERMISOS = {
+    'admin': frozenset({
+        'crear_empleado', 'buscar_empleado', 'listar_empleados', 
+        'actualizar_empleado', 'eliminar_empleado',
+        'crear_departamento', 'actualizar_departamento', 'eliminar_departamento',
+        'crear_proyecto', 'actualizar_proyecto', 'eliminar_proyecto',
+        'ver_proyectos', 'listar_proyectos', 'asignar_empleado_proyecto', 'desasignar_empleado_proyecto',
+        'registrar_tiempo', 'actualizar_registro', 'eliminar_registro',
+        'generar_informes', 'cambiar_contraseña', 'ver_informes'
+    }),
+    'supervisor': frozenset({
+        'buscar_empleado', 'listar_empleados', 
+        'registrar_tiempo', 'actualizar_registro',
+        'ver_proyectos', 'listar_proyectos',
+        'cambiar_contraseña', 'ver_informes'
+    }),
+    'empleado': frozenset({
+        'buscar_empleado', 'listar_empleados',
+        'registrar_tiempo', 'ver_proyectos',
+        'cambiar_contraseña'
+    })
+}
+
+# Para roles desconocidos
+_SIN_PERMISOS = frozenset()
+
+# Hilos para hashear en crear_usuarios_bulk(). Cada hash Argon2 reserva ~46 MiB,
+# así que lo dejo en un número fijo y chico en vez de os.cpu_count()
+_HILOS_HASH = 4
+
+# Referencia directa a hashlib.sha256 (se usa para verificar los hashes heredados)
+_sha256 = hashlib.sha256
+
+# Fila de listar_usuarios(): una tupla liviana en vez de un dict por usuario.
+# Se accede por nombre (usuario.nombre_usuario) igual que antes por clave.
+Usuario = namedtuple('Usuario', 'id nombre_usuario rol email activo ultimo_login')
+
 
 class Autenticacion:
     """Clase para gestionar autenticación y seguridad del sistema."""
     
-    ROLES = ["admin", "supervisor", "empleado"]
+    # frozenset para verificar "rol in ROLES" por hash; ROLES_DISPLAY conserva el
+    # orden para los mensajes
+    ROLES_DISPLAY = ("admin", "supervisor", "empleado")
+    ROLES = frozenset(ROLES_DISPLAY)
+    
+    # Argon2id con los parámetros recomendados por OWASP (46 MiB, 3 iteraciones).
+    # Un solo objeto para toda la aplicación: guarda la configuración y es thread-safe.
+    _PH = PasswordHasher(time_cost=3, memory_cost=46 * 1024, parallelism=1, hash_len=32)
     
     @staticmethod
     def _hash_password(contraseña):
         """
-        Hashea una contraseña usando SHA-256.
+        Hashea una contraseña usando Argon2id.
         Nunca almaceno contraseñas en texto plano en la BD.
         Esto es un requisito de seguridad fundamental. Si alguien roba la BD,
         las contraseñas siguen siendo seguras porque no se pueden "desencriptar".
+        Antes usaba SHA-256 sin sal, que con una GPU se prueba a miles de millones
+        de intentos por segundo; Argon2id además de ser lento usa mucha memoria,
+        lo que hace muy caro el ataque por fuerza bruta. Cada hash lleva su propia sal.
         
         Args:
             contraseña (str): Contraseña en texto plano
             
         Returns:
-            str: Contraseña hasheada
+            str: Contraseña hasheada (formato $argon2id$...)
         """
-        return hashlib.sha256(contraseña.encode()).hexdigest()
+        return Autenticacion._PH.hash(contraseña)
     
     @staticmethod
-    def crear_tabla_usuarios():
-        """Crea la tabla de usuarios si no existe."""
-        ddl = """
-        CREATE TABLE usuarios (
-            id_usuario NUMBER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
-            nombre_usuario VARCHAR2(50) NOT NULL UNIQUE,
-            contraseña_hash VARCHAR2(64) NOT NULL,
-            rol VARCHAR2(20) NOT NULL,
-            email VARCHAR2(100),
-            activo NUMBER DEFAULT 1,
-            fecha_creacion DATE DEFAULT SYSDATE,
-            ultimo_login DATE,
-            intentos_fallidos NUMBER DEFAULT 0
-        )
+    @lru_cache(maxsize=1)
+    def _hash_ficticio():
+        """
+        Hash de relleno para los logins con usuarios inexistentes: verificarlo cuesta lo
+        mismo que un login real, así el tiempo de respuesta no delata qué usuarios existen.
+        Lo calculo recién en el primer login fallido (y lo guardo) para no sumar el
+        costo de un hash Argon2 a cada 'import seguridad'.
+        """
+        return Autenticacion._PH.hash("no-es-una-contraseña-real")
+    
+    @staticmethod
+    def _verificar_password(contraseña, hash_guardado):
         """
+        Compara una contraseña con el hash guardado en la BD.
+        Con Argon2 no puedo comparar en el SQL (cada hash tiene su sal), así que
+        traigo el hash y lo verifico aquí. También acepto los hashes SHA-256 que
+        quedaron de la versión anterior, para migrarlos a Argon2id en el próximo login.
         
-        try:
-            with get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Verificar si la tabla ya existe
-                    cur.execute("""
-                        SELECT COUNT(*) 
-                        FROM user_tables 
-                        WHERE table_name = 'USUARIOS'
-                    """)
-                    exists = cur.fetchone()[0]
-                    
-                    if exists:
-                        print("[WARN] La tabla 'usuarios' ya existe")
-                    else:
-                        cur.execute(ddl)
-                        print("[OK] Tabla 'usuarios' creada exitosamente")
-        except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al crear tabla usuarios: {e}")
+        Args:
+            contraseña (str): Contraseña en texto plano
+            hash_guardado (str): Hash almacenado en la BD
+            
+        Returns:
+            tuple: (coincide, necesita_rehash)
+        """
+        if hash_guardado.startswith("$argon2"):
+            try:
+                Autenticacion._PH.verify(hash_guardado, contraseña)
+            except (VerificationError, InvalidHashError):
+                return False, False
+            return True, Autenticacion._PH.check_needs_rehash(hash_guardado)
+        
+        # Hash SHA-256 heredado (64 caracteres hex): comparo en tiempo constante.
+        # No lo delego a Oracle con DBMS_CRYPTO.HASH: es un camino de migración que
+        # desaparece con el primer login, y exigiría el permiso EXECUTE sobre DBMS_CRYPTO.
+        hash_legado = _sha256(contraseña.encode('utf-8')).hexdigest()
+        coincide = hmac.compare_digest(hash_legado, hash_guardado)
+        return coincide, coincide
+    
+    @staticmethod
+    def crear_tabla_usuarios():
+        """
+        Crea la tabla de usuarios si no existe, junto con el índice del login.
+        La definición vive en database.conexion.create_table_usuarios() (la misma
+        que usa main.py), así hay un solo lugar donde mantenerla.
+        """
+        create_table_usuarios()
     
     @staticmethod
     def crear_usuario_admin_inicial():
@@ -76,31 +210,29 @@ class Autenticacion:
             with get_connection() as conn:
                 with conn.cursor() as cur:
                     # Verificar si hay usuarios
-                    cur.execute("SELECT COUNT(*) FROM usuarios")
+                    cur.execute(_SQL_CONTAR_USUARIOS)
                     count = cur.fetchone()[0]
                     
                     if count == 0:
                         # Crear usuario admin por defecto
                         admin_hash = Autenticacion._hash_password("admin123")
-                        cur.execute("""
-                            INSERT INTO usuarios 
-                            (nombre_usuario, contraseña_hash, rol, email, activo)
-                            VALUES ('admin', :hash, 'admin', 'admin@empresa.com', 1)
-                        """, {"hash": admin_hash})
+                        cur.execute(_SQL_INSERT_ADMIN, {"hash": admin_hash})
                         conn.commit()
                         print("[OK] Usuario admin inicial creado (usuario: admin, contraseña: admin123)")
                         print("  [WARN] IMPORTANTE: Cambia la contraseña del admin al primer login")
         except oracledb.DatabaseError as e:
-            print(f"[WARN] Error al crear usuario admin: {e}")
+            logger.warning("Error al crear usuario admin: %s", e)
     
     @staticmethod
     def validar_credenciales(nombre_usuario, contraseña):
         """
         Valida las credenciales de un usuario.
         Esta es una de las funciones más críticas de seguridad.
-        Comparo el hash de la contraseña ingresada con el hash guardado en la BD.
+        Traigo el hash guardado en la BD y lo verifico con Argon2 (ver _verificar_password).
         Si no coinciden, también incremento el contador de intentos fallidos para
         implementar protección contra fuerza bruta (aunque no la bloqueo automáticamente aquí).
+        Si el hash guardado es SHA-256 o usa parámetros antiguos, aprovecho el login
+        exitoso (único momento en que tengo la contraseña) para guardarlo en Argon2id.
         
         Args:
             nombre_usuario (str): Nombre de usuario
@@ -112,43 +244,41 @@ class Autenticacion:
         try:
             with get_connection() as conn:
                 with conn.cursor() as cur:
-                    contraseña_hash = Autenticacion._hash_password(contraseña)
-                    
-                    cur.execute("""
-                        SELECT id_usuario, nombre_usuario, rol, email, activo
-                        FROM usuarios
-                        WHERE nombre_usuario = :usuario AND contraseña_hash = :hash AND activo = 1
-                    """, {"usuario": nombre_usuario, "hash": contraseña_hash})
+                    cur.execute(_SQL_SELECT_LOGIN, {"usuario": nombre_usuario})
                     
                     row = cur.fetchone()
-                    
                     if row:
-                        # Resetear intentos fallidos y actualizar último login
-                        cur.execute("""
-                            UPDATE usuarios
-                            SET ultimo_login = SYSDATE, intentos_fallidos = 0
-                            WHERE id_usuario = :id
-                        """, {"id": row[0]})
-                        conn.commit()
-                        
-                        return {
-                            'id_usuario': row[0],
-                            'nombre_usuario': row[1],
-                            'rol': row[2],
-                            'email': row[3]
-                        }
+                        coincide, necesita_rehash = Autenticacion._verificar_password(contraseña, row[4])
                     else:
-                        # Incrementar intentos fallidos
-                        cur.execute("""
-                            UPDATE usuarios
-                            SET intentos_fallidos = intentos_fallidos + 1
-                            WHERE nombre_usuario = :usuario
-                        """, {"usuario": nombre_usuario})
-                        conn.commit()
-                        
+                        # Usuario inexistente o inactivo: igual hago una verificación
+                        # Argon2 completa para que tarde lo mismo que una contraseña errónea
+                        Autenticacion._verificar_password(contraseña, Autenticacion._hash_ficticio())
+                        coincide, necesita_rehash = False, False
+                    
+                    # Registro el resultado del intento y hago commit en un solo viaje a
+                    # la BD (bloque PL/SQL) en vez de un UPDATE y después un COMMIT.
+                    # Si hubo éxito: reseteo intentos fallidos, actualizo último login y,
+                    # si corresponde, migro el hash (NVL deja el actual si :hash es NULL).
+                    # Si no: incremento los intentos fallidos del nombre de usuario.
+                    nuevo_hash = Autenticacion._hash_password(contraseña) if necesita_rehash else None
+                    cur.execute(_SQL_REGISTRAR_LOGIN, {
+                        "exito": 1 if coincide else 0,
+                        "hash": nuevo_hash,
+                        "id": row[0] if row else None,
+                        "usuario": nombre_usuario
+                    })
+                    
+                    if not coincide:
                         return None
+                    
+                    return {
+                        'id_usuario': row[0],
+                        'nombre_usuario': row[1],
+                        'rol': row[2],
+                        'email': row[3]
+                    }
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al validar credenciales: {e}")
+            logger.error("Error al validar credenciales: %s", e)
             return None
     
     @staticmethod
@@ -168,33 +298,26 @@ class Autenticacion:
             with get_connection() as conn:
                 with conn.cursor() as cur:
                     # Verificar contraseña actual
-                    hash_actual = Autenticacion._hash_password(contraseña_actual)
-                    cur.execute("""
-                        SELECT id_usuario FROM usuarios
-                        WHERE id_usuario = :id AND contraseña_hash = :hash
-                    """, {"id": id_usuario, "hash": hash_actual})
+                    cur.execute(_SQL_SELECT_HASH_POR_ID, {"id": id_usuario})
                     
-                    if not cur.fetchone():
-                        print("[ERROR] Contraseña actual incorrecta")
+                    row = cur.fetchone()
+                    if not row or not Autenticacion._verificar_password(contraseña_actual, row[0])[0]:
+                        logger.error("Contraseña actual incorrecta")
                         return False
                     
                     # Actualizar contraseña
                     if len(contraseña_nueva) < 6:
-                        print("[ERROR] La nueva contraseña debe tener al menos 6 caracteres")
+                        logger.error("La nueva contraseña debe tener al menos 6 caracteres")
                         return False
                     
                     hash_nueva = Autenticacion._hash_password(contraseña_nueva)
-                    cur.execute("""
-                        UPDATE usuarios
-                        SET contraseña_hash = :hash
-                        WHERE id_usuario = :id
-                    """, {"hash": hash_nueva, "id": id_usuario})
+                    cur.execute(_SQL_UPDATE_HASH, {"hash": hash_nueva, "id": id_usuario})
                     conn.commit()
                     
                     print("[OK] Contraseña cambiada exitosamente")
                     return True
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al cambiar contraseña: {e}")
+            logger.error("Error al cambiar contraseña: %s", e)
             return False
     
     @staticmethod
@@ -203,7 +326,8 @@ class Autenticacion:
         Verifica si un rol tiene permiso para realizar una acción.
         Aquí implementé el concepto de Control de Acceso Basado en Roles (RBAC).
         Tengo 3 roles: admin (acceso total), supervisor (acceso limitado),
-        y empleado (acceso muy restringido). Cada rol tiene una lista de acciones permitidas.
+        y empleado (acceso muy restringido). Cada rol tiene un conjunto de acciones
+        permitidas, definido en _PERMISOS.
         
         Args:
             rol (str): Rol del usuario
@@ -212,30 +336,7 @@ class Autenticacion:
         Returns:
             bool: True si tiene permiso, False en caso contrario
         """
-        permisos = {
-            'admin': [
-                'crear_empleado', 'buscar_empleado', 'listar_empleados', 
-                'actualizar_empleado', 'eliminar_empleado',
-                'crear_departamento', 'actualizar_departamento', 'eliminar_departamento',
-                'crear_proyecto', 'actualizar_proyecto', 'eliminar_proyecto',
-                'asignar_empleado_proyecto', 'desasignar_empleado_proyecto',
-                'registrar_tiempo', 'actualizar_registro', 'eliminar_registro',
-                'generar_informes', 'cambiar_contraseña', 'ver_informes'
-            ],
-            'supervisor': [
-                'buscar_empleado', 'listar_empleados', 
-                'registrar_tiempo', 'actualizar_registro',
-                'ver_proyectos', 'listar_proyectos',
-                'cambiar_contraseña', 'ver_informes'
-            ],
-            'empleado': [
-                'buscar_empleado', 'listar_empleados',
-                'registrar_tiempo', 'ver_proyectos',
-                'cambiar_contraseña'
-            ]
-        }
-        
-        return accion in permisos.get(rol, [])
+        return accion in _PERMISOS.get(rol, _SIN_PERMISOS)
     
     @staticmethod
     def crear_usuario(nombre_usuario, contraseña, rol, email=None):
@@ -252,22 +353,18 @@ class Autenticacion:
             bool: True si se creó exitosamente, False en caso contrario
         """
         if len(contraseña) < 6:
-            print("[ERROR] La contraseña debe tener al menos 6 caracteres")
+            logger.error("La contraseña debe tener al menos 6 caracteres")
             return False
         
         if rol not in Autenticacion.ROLES:
-            print(f"[ERROR] Rol inválido. Roles válidos: {', '.join(Autenticacion.ROLES)}")
+            logger.error("Rol inválido. Roles válidos: %s", ', '.join(Autenticacion.ROLES_DISPLAY))
             return False
         
         try:
             with get_connection() as conn:
                 with conn.cursor() as cur:
                     contraseña_hash = Autenticacion._hash_password(contraseña)
-                    cur.execute("""
-                        INSERT INTO usuarios 
-                        (nombre_usuario, contraseña_hash, rol, email, activo)
-                        VALUES (:usuario, :hash, :rol, :email, 1)
-                    """, {
+                    cur.execute(_SQL_INSERT_USUARIO, {
                         "usuario": nombre_usuario,
                         "hash": contraseña_hash,
                         "rol": rol,
@@ -278,39 +375,84 @@ class Autenticacion:
                     return True
         except oracledb.DatabaseError as e:
             if "UNIQUE constraint" in str(e):
-                print(f"[ERROR] El usuario '{nombre_usuario}' ya existe")
+                logger.error("El usuario '%s' ya existe", nombre_usuario)
             else:
-                print(f"[ERROR] Error al crear usuario: {e}")
+                logger.error("Error al crear usuario: %s", e)
             return False
     
+    @staticmethod
+    def crear_usuarios_bulk(items):
+        """
+        Crea muchos usuarios de una vez (por ejemplo, en un script de incorporación).
+        
+        En vez de llamar crear_usuario() por cada uno (una conexión y un commit por
+        usuario) inserto todas las filas con executemany() y hago un solo commit.
+        Argon2 es costoso a propósito, así que calculo los hashes en paralelo con
+        hilos: argon2-cffi libera el GIL mientras hashea.
+        
+        Args:
+            items (iterable): Tuplas (nombre_usuario, contraseña, rol, email)
+            
+        Returns:
+            int: Cantidad de usuarios creados
+        """
+        items = list(items)
+        validos = []
+        for nombre_usuario, contraseña, rol, email in items:
+            if len(contraseña) < 6:
+                logger.error("Usuario '%s': la contraseña debe tener al menos 6 caracteres", nombre_usuario)
+            elif rol not in Autenticacion.ROLES:
+                logger.error("Usuario '%s': rol inválido '%s'", nombre_usuario, rol)
+            else:
+                validos.append((nombre_usuario, contraseña, rol, email))
+        if not validos:
+            return 0
+        
+        with ThreadPoolExecutor(max_workers=_HILOS_HASH) as executor:
+            hashes = list(executor.map(Autenticacion._hash_password, [v[1] for v in validos]))
+        data = [
+            {"usuario": u, "hash": h, "rol": r, "email": e}
+            for (u, _, r, e), h in zip(validos, hashes)
+        ]
+        
+        try:
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.executemany(_SQL_INSERT_USUARIO, data, batcherrors=True)
+                    errores = cur.getbatcherrors()
+                    for error in errores:
+                        nombre_usuario = data[error.offset]["usuario"]
+                        if error.code == ORA_UNIQUE:
+                            logger.error("El usuario '%s' ya existe", nombre_usuario)
+                        else:
+                            logger.error("Usuario '%s' no se pudo crear: %s", nombre_usuario, error.message)
+                    conn.commit()
+                    creados = len(data) - len(errores)
+                    print(f"[OK] {creados} de {len(items)} usuarios creados")
+                    return creados
+        except oracledb.DatabaseError as e:
+            logger.error("Error al crear usuarios: %s", e)
+            return 0
+    
     @staticmethod
     def listar_usuarios():
         """
         Lista todos los usuarios del sistema.
         
         Returns:
-            list: Lista de usuarios
+            list: Lista de Usuario (namedtuple)
         """
         usuarios = []
         try:
             with get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT id_usuario, nombre_usuario, rol, email, activo, ultimo_login
-                        FROM usuarios
-                        ORDER BY nombre_usuario
-                    """)
-                    for row in cur.fetchall():
-                        usuarios.append({
-                            'id': row[0],
-                            'nombre_usuario': row[1],
-                            'rol': row[2],
-                            'email': row[3],
-                            'activo': row[4],
-                            'ultimo_login': row[5]
-                        })
+                    # Traer hasta 1000 filas por viaje de red (por defecto son 100)
+                    cur.arraysize = 1000
+                    cur.prefetchrows = 1001
+                    cur.execute(_SQL_LISTAR_USUARIOS)
+                    usuarios = [Usuario(*row) for row in cur]
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al listar usuarios: {e}")
+            logger.error("Error al listar usuarios: %s", e)
         
         return usuarios
     
@@ -328,21 +470,17 @@ class Autenticacion:
         try:
             with get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        UPDATE usuarios
-                        SET activo = 0
-                        WHERE id_usuario = :id
-                    """, {"id": id_usuario})
+                    cur.execute(_SQL_DESACTIVAR_USUARIO, {"id": id_usuario})
                     
                     if cur.rowcount == 0:
-                        print("[ERROR] Usuario no encontrado")
+                        logger.error("Usuario no encontrado")
                         return False
                     
                     conn.commit()
                     print("[OK] Usuario desactivado exitosamente")
                     return True
         except oracledb.DatabaseError as e:
-            print(f"[ERROR] Error al desactivar usuario: {e}")
+            logger.error("Error al desactivar usuario: %s", e)
             return False
 
 
@@ -357,6 +495,10 @@ class ControlAcceso:
             usuario_actual (dict): Datos del usuario autenticado
         """
         self.usuario_actual = usuario_actual
+        # Guardo el rol y su conjunto de permisos porque se consultan en cada acción
+        # del menú; así verificar_permiso() es una sola búsqueda por hash
+        self._rol = usuario_actual['rol'] if usuario_actual else None
+        self._perms = _PERMISOS.get(self._rol, _SIN_PERMISOS)
     
     def verificar_permiso(self, accion):
         """
@@ -369,19 +511,20 @@ class ControlAcceso:
             bool: True si tiene permiso, False en caso contrario
         """
         if not self.usuario_actual:
-            print("[ERROR] No hay usuario autenticado")
+            logger.error("No hay usuario autenticado")
             return False
         
-        tiene_permiso = Autenticacion.tiene_permiso(self.usuario_actual['rol'], accion)
+        # Misma tabla _PERMISOS que Autenticacion.tiene_permiso(), así ambas coinciden
+        tiene_permiso = accion in self._perms
         
         if not tiene_permiso:
-            print(f"[ERROR] El rol '{self.usuario_actual['rol']}' no tiene permiso para '{accion}'")
+            logger.error("El rol '%s' no tiene permiso para '%s'", self._rol, accion)
         
         return tiene_permiso
     
     def obtener_rol(self):
         """Retorna el rol del usuario actual."""
-        return self.usuario_actual['rol'] if self.usuario_actual else None
+        return self._rol
     
     def obtener_usuario(self):
         """Retorna el nombre del usuario actual."""
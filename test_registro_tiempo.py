@@ -28,7 +28,7 @@ resultado = reg.crear()
 print(f"✓ Guardado: {resultado}")
 
 print("\nProbando listado...")
-registros = RegistroTiempo.listar_todos(limit=10)
+registros = RegistroTiempo.listar_paginado(0, 10)
 print(f"✓ Se encontraron {len(registros)} registros")
 if registros:
     print(f"\nÚltimo registro:")
@@ -4,12 +4,47 @@ SCRIPT DE VERIFICACIÓN - Sistema de Gestión de Empleados
 Verifica que todas las características estén implementadas correctamente
 """
 
+import mmap
 import os
 import sys
-from pathlib import Path
 
 
-def verificar_estructura():
+def listar_archivos():
+    """
+    Retorna las rutas de los archivos del proyecto (raíz, database/ y models/).
+    Un solo os.scandir() por carpeta entrega todos los nombres de una vez, en vez
+    de una llamada a stat() por cada archivo que se quiere comprobar.
+    """
+    presentes = set()
+    for carpeta in (".", "database", "models"):
+        try:
+            with os.scandir(carpeta) as entradas:
+                for entrada in entradas:
+                    presentes.add(entrada.name if carpeta == "." else f"{carpeta}/{entrada.name}")
+        except FileNotFoundError:
+            pass
+    return presentes
+
+
+def contar_lineas(ruta):
+    """
+    Cuenta las líneas de un archivo contando los saltos de línea sobre un mmap,
+    en bloques de 1 MiB con bytes.count() (el conteo lo hace C, no un bucle por
+    línea) y sin crear un string por cada línea. Una última línea sin salto también cuenta.
+    """
+    with open(ruta, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0  # mmap no admite archivos vacíos
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lineas = 0
+            bloque = mm.read(1 << 20)
+            while bloque:
+                lineas += bloque.count(b'\n')
+                bloque = mm.read(1 << 20)
+            return lineas + (mm[-1:] != b'\n')
+
+
+def verificar_estructura(presentes):
     """Verifica la estructura de archivos del proyecto"""
     print("\n" + "="*60)
     print("VERIFICACIÓN DE ESTRUCTURA DE ARCHIVOS")
@@ -30,7 +65,7 @@ def verificar_estructura():
     }
     
     for archivo, descripcion in archivos_requeridos.items():
-        existe = Path(archivo).exists()
+        existe = archivo in presentes
         estado = "✅" if existe else "⚠️"
         print(f"{estado} {archivo:35s} - {descripcion}")
         if not existe and archivo != ".env":
@@ -126,32 +161,28 @@ def verificar_clases():
     print("\n✅ Clases verificadas")
 
 
-def verificar_base_datos():
+def verificar_base_datos(presentes):
     """Verifica la configuración de base de datos"""
     print("\n" + "="*60)
     print("VERIFICACIÓN DE BASE DE DATOS")
     print("="*60)
     
     try:
-        env_path = Path(".env")
-        if env_path.exists():
+        if ".env" in presentes:
             print("▶ Archivo .env encontrado")
-            with open(".env") as f:
-                contenido = f.read()
-                if "ORACLE_USER" in contenido:
-                    print("   ✅ ORACLE_USER configurado")
-                else:
-                    print("   ❌ ORACLE_USER no configurado")
-                
-                if "ORACLE_PASSWORD" in contenido:
-                    print("   ✅ ORACLE_PASSWORD configurado")
-                else:
-                    print("   ❌ ORACLE_PASSWORD no configurado")
-                
-                if "ORACLE_DSN" in contenido:
-                    print("   ✅ ORACLE_DSN configurado")
+            variables = ("ORACLE_USER", "ORACLE_PASSWORD", "ORACLE_DSN")
+            configuradas = set()
+            with open(".env", 'rb') as f:
+                if os.fstat(f.fileno()).st_size > 0:  # mmap no admite archivos vacíos
+                    # Busco cada variable directamente sobre el mmap del archivo
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        configuradas = {v for v in variables if mm.find(v.encode()) != -1}
+            
+            for variable in variables:
+                if variable in configuradas:
+                    print(f"   ✅ {variable} configurado")
                 else:
-                    print("   ❌ ORACLE_DSN no configurado")
+                    print(f"   ❌ {variable} no configurado")
         else:
             print("⚠️  Archivo .env no encontrado")
             print("   Asegúrate de crear el archivo .env con las credenciales")
@@ -160,7 +191,7 @@ def verificar_base_datos():
         print(f"❌ Error al verificar .env: {e}")
 
 
-def verificar_documentacion():
+def verificar_documentacion(presentes):
     """Verifica que la documentación esté completa"""
     print("\n" + "="*60)
     print("VERIFICACIÓN DE DOCUMENTACIÓN")
@@ -174,10 +205,8 @@ def verificar_documentacion():
     }
     
     for doc, desc in docs.items():
-        existe = Path(doc).exists()
-        if existe:
-            with open(doc) as f:
-                lineas = len(f.readlines())
+        if doc in presentes:
+            lineas = contar_lineas(doc)
             estado = "✅"
             print(f"{estado} {doc:40s} ({lineas} líneas)")
         else:
@@ -190,12 +219,13 @@ def main():
     print("🔍 VERIFICACIÓN DEL SISTEMA - ES2 POO")
     print("="*60)
     
-    verificar_estructura()
+    presentes = listar_archivos()
+    verificar_estructura(presentes)
     
     if verificar_imports():
         verificar_clases()
-        verificar_base_datos()
-        verificar_documentacion()
+        verificar_base_datos(presentes)
+        verificar_documentacion(presentes)
     
     print("\n" + "="*60)
     print("✅ VERIFICACIÓN COMPLETADA")